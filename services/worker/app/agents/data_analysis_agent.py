@@ -22,7 +22,7 @@ from app.prompts.analysis_prompts import (
     INTENT_ANALYSIS_PROMPT,
     TASK_SAFETY_FILTER_PROMPT,
 )
-from app.tools.bigquery.client import BigQueryClient
+from app.tools.bigquery.client import get_shared_client
 
 logger = structlog.get_logger()
 
@@ -33,7 +33,7 @@ class DataAnalysisAgent(BaseAgent, WorkflowNodes, WorkflowNodesPart2):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.settings = get_settings()
-        self.bq_client = BigQueryClient(
+        self.bq_client = get_shared_client(
             project_id=self.settings.google_cloud.bigquery_project_id,
             credentials_path=self.settings.google_cloud.credentials_path,
         )
@@ -1,7 +1,7 @@
 """数据分析代理的工作流节点实现"""
 
 import json
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import pandas as pd
 import structlog
@@ -12,7 +12,7 @@ from app.prompts.analysis_prompts import (
     ANALYSIS_REPORT_PROMPT,
     ERROR_ANALYSIS_PROMPT,
     INTENT_ANALYSIS_PROMPT,
-    TASK_SAFETY_FILTER_PROMPT,
+    render_task_safety_filter,
 )
 
 logger = structlog.get_logger()
@@ -163,7 +163,7 @@ class WorkflowNodes:
             user_task = state["user_task"]
 
             # 使用LLM进行安全过滤
-            prompt = TASK_SAFETY_FILTER_PROMPT.format(user_task=user_task)
+            prompt = render_task_safety_filter(user_task)
             response = self.llm.invoke([HumanMessage(content=prompt)])
 
             # 解析响应
@@ -232,18 +232,17 @@ class WorkflowNodes:
                 state["error_message"] = f"数据集 '{dataset}' 中没有表格，无法继续"
                 return state
 
-            schemas = {}
-
             print("Reading Table Schema...")
 
-            for table in tables:
-                try:
-                    schema = self.bq_client.get_table_schema(dataset, table)
-                    schemas[table] = schema
-                    print(f"✓ Successfully read {table} schema")
-                except Exception as e:
-                    logger.warning("读取表结构失败", table=table, error=str(e))
-                    schemas[table] = []
+            # 一次INFORMATION_SCHEMA批量查询读取全部表结构；批量失败时才逐表读取
+            try:
+                schemas = {table: [] for table in tables}
+                for table_info in self.bq_client.get_tables_info(dataset, tables):
+                    schemas[table_info["id"]] = table_info["schema"]
+                    print(f"✓ Successfully read {table_info['id']} schema")
+            except Exception as e:
+                logger.warning("批量读取表结构失败，改为逐表读取", error=str(e))
+                schemas = self._read_schemas_one_by_one(dataset, tables)
 
             state["table_schemas"] = schemas
             logger.info("表结构读取完成", dataset=dataset, tables_count=len(schemas))
@@ -253,3 +252,17 @@ class WorkflowNodes:
             state["error_message"] = f"读取表结构失败: {str(e)}"
 
         return state
+
+    def _read_schemas_one_by_one(
+        self, dataset: str, tables: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """逐表读取表结构，单个表失败时记为空结构并继续"""
+        schemas = {}
+        for table in tables:
+            try:
+                schemas[table] = self.bq_client.get_table_schema(dataset, table)
+                print(f"✓ Successfully read {table} schema")
+            except Exception as e:
+                logger.warning("读取表结构失败", table=table, error=str(e))
+                schemas[table] = []
+        return schemas
@@ -1,17 +1,19 @@
 """数据分析代理的工作流节点实现 - 第二部分"""
 
+import hashlib
 import json
 from typing import Any, Dict, List
 
 import pandas as pd
 import structlog
+from pandas.api.types import is_datetime64_any_dtype, is_object_dtype
 from langchain_core.messages import AIMessage, HumanMessage
 
 from app.agents.state import AppState
 from app.prompts.analysis_prompts import (
-    ANALYSIS_REPORT_PROMPT,
     ERROR_ANALYSIS_PROMPT,
-    INTENT_ANALYSIS_PROMPT,
+    render_analysis_report,
+    render_intent_analysis,
 )
 
 logger = structlog.get_logger()
@@ -37,17 +39,22 @@ class WorkflowNodesPart2:
                 table_schemas, state["selected_dataset"]
             )
 
-            # 使用LLM生成SQL查询
-            prompt = INTENT_ANALYSIS_PROMPT.format(
-                user_task=user_task, table_schemas=schema_info
-            )
+            # 使用LLM生成SQL查询，相同提示词直接复用已缓存的响应
+            prompt = render_intent_analysis(user_task, schema_info)
+            cache_key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+            cached = self.memory.retrieve_cached_result(cache_key)
 
-            # print("正在分析意图并生成查询...")
-            response = self.llm.invoke([HumanMessage(content=prompt)])
+            if cached is not None:
+                raw_content = cached["response"]
+                logger.info("命中查询生成缓存", cache_key=cache_key)
+            else:
+                # print("正在分析意图并生成查询...")
+                response = self.llm.invoke([HumanMessage(content=prompt)])
+                raw_content = response.content.strip()
 
             try:
                 # 尝试从响应中提取JSON部分
-                response_content = response.content.strip()
+                response_content = raw_content
                 logger.info("查询生成LLM原始响应", response=response_content)
 
                 # 如果响应包含markdown代码块，提取JSON部分
@@ -63,6 +70,8 @@ class WorkflowNodesPart2:
                         response_content = response_content[start:end].strip()
 
                 analysis_result = json.loads(response_content)
+                if cached is None:
+                    self.memory.store_cached_result(cache_key, {"response": raw_content})
 
                 # 提取生成的查询
                 queries = []
@@ -95,9 +104,7 @@ class WorkflowNodesPart2:
                 )
 
             except (json.JSONDecodeError, KeyError) as e:
-                logger.error(
-                    "查询生成响应解析失败", response=response.content, error=str(e)
-                )
+                logger.error("查询生成响应解析失败", response=raw_content, error=str(e))
                 state["error_message"] = "查询生成失败，请重新描述任务"
 
         except Exception as e:
@@ -212,14 +219,16 @@ class WorkflowNodesPart2:
                         timeout=self.settings.google_cloud.bigquery_timeout,
                         max_results=self.settings.google_cloud.bigquery_max_results,
                     )
+                    # 日期时间列转为ISO字符串，结果可直接序列化到外部记忆
+                    self._serialize_datetime_columns(df)
+                    records = self._frame_to_records(df)
 
                     # 检查结果大小，如果太大则存储到外部记忆
-                    result_size = len(str(df.to_dict("records")))
-                    if result_size > 50000:  # 50KB阈值
+                    if self._records_exceed(records, 50000):  # 50KB阈值
                         # 存储大型结果到外部记忆
                         summary = f"查询 {query_index} 结果: {len(df)} 行 x {len(df.columns)} 列"
                         memory_key = self.memory.store_large_result(
-                            self.session_id, df.to_dict("records"), summary
+                            self.session_id, records, summary
                         )
 
                         result_data = {
@@ -231,7 +240,7 @@ class WorkflowNodesPart2:
                             "is_large_result": True,
                             "memory_key": memory_key,
                             "summary": summary,
-                            "sample_data": df.head(5).to_dict("records"),
+                            "sample_data": records[:5],
                         }
 
                         # 更新记忆键列表
@@ -247,7 +256,7 @@ class WorkflowNodesPart2:
                             "column_count": len(df.columns),
                             "columns": list(df.columns),
                             "is_large_result": False,
-                            "data": df.to_dict("records"),
+                            "data": records,
                         }
 
                     query_results.append(result_data)
@@ -296,9 +305,7 @@ class WorkflowNodesPart2:
             results_summary = self._prepare_results_for_report(query_results)
 
             # 使用LLM生成分析报告
-            prompt = ANALYSIS_REPORT_PROMPT.format(
-                user_task=user_task, query_results=results_summary
-            )
+            prompt = render_analysis_report(user_task, results_summary)
 
             print("Generating analysis report...")
             response = self.llm.invoke([HumanMessage(content=prompt)])
@@ -370,6 +377,54 @@ class WorkflowNodesPart2:
             return f"{query} LIMIT {limit}"
         return query
 
+    def _serialize_datetime_columns(self, df: pd.DataFrame) -> None:
+        """将DataFrame中的日期时间列原地转换为ISO格式字符串
+
+        按列的dtype判断：datetime64列在结果与isoformat()一致时（无时区或UTC、
+        没有亚秒部分）用向量化的strftime转换，否则逐值调用isoformat()；
+        object及db-dtypes的dbdate/dbtime列只检查第一个非空值的类型，不逐行探测。
+        """
+        for col in df.columns:
+            series = df[col]
+            dtype = series.dtype
+            if is_datetime64_any_dtype(dtype):
+                tz = series.dt.tz
+                valid = series.dropna()
+                if (tz is None or str(tz) == "UTC") and (valid.dt.floor("s") == valid).all():
+                    # isoformat()对UTC时间输出"+00:00"偏移，无时区时不带偏移
+                    offset = "" if tz is None else "+00:00"
+                    formatted = series.dt.strftime(f"%Y-%m-%dT%H:%M:%S{offset}")
+                else:
+                    formatted = series.map(lambda value: value.isoformat(), na_action="ignore")
+                df[col] = formatted.where(series.notna(), None)
+            elif is_object_dtype(dtype) or dtype.name in ("dbdate", "dbtime"):
+                first_index = series.first_valid_index()
+                if first_index is not None and hasattr(series.at[first_index], "isoformat"):
+                    df[col] = series.map(
+                        lambda value: value.isoformat() if pd.notna(value) else None
+                    )
+
+    def _records_exceed(self, records: List[Dict[str, Any]], limit: int) -> bool:
+        """判断 str(records) 的长度是否超过limit，不构建整个结果的字符串副本
+
+        逐行累加文本长度，超过阈值即提前返回，大结果只需扫描到阈值为止。
+        """
+        size = 2  # 列表的方括号
+        for row in records:
+            size += len(str(row)) + 2  # 行文本及 ", " 分隔符
+            if size > limit:
+                return True
+        return False
+
+    def _frame_to_records(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """将DataFrame转换为行字典列表，等价于 df.to_dict("records")
+
+        每列只做一次向量化的 tolist()，再按行zip成字典，避免pandas逐个单元格装箱。
+        """
+        columns = list(df.columns)
+        column_values = [df.iloc[:, i].tolist() for i in range(len(columns))]
+        return [dict(zip(columns, row)) for row in zip(*column_values)]
+
     def _prepare_results_for_report(self, query_results: List[Dict]) -> str:
         """准备查询结果用于报告生成"""
         results_summary = ""
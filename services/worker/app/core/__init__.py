@@ -1,7 +1,13 @@
 """Core modules for the worker service."""
 
 from .config import Settings, get_settings, reload_settings, Environment, LogLevel
-from .logging import setup_logging, get_logger, LoggerMixin, RequestLogger
+from .logging import (
+    setup_logging,
+    get_logger,
+    get_fast_logger,
+    LoggerMixin,
+    RequestLogger,
+)
 from .exceptions import (
     BaseWorkerException,
     ValidationError,
@@ -33,6 +39,7 @@ __all__ = [
     # Logging
     "setup_logging",
     "get_logger",
+    "get_fast_logger",
     "LoggerMixin",
     "RequestLogger",
     # Exceptions
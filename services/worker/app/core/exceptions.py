@@ -1,6 +1,6 @@
 """Custom exceptions for the worker service."""
 
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from enum import Enum
 
 
@@ -46,6 +46,34 @@ class ErrorCode(str, Enum):
     QUOTA_EXCEEDED = "QUOTA_EXCEEDED"
 
 
+def _merge_details(details: Optional[Dict[str, Any]], **fields: Any) -> Dict[str, Any]:
+    """Build an exception details dict in one pass.
+
+    Args:
+        details: Caller-supplied details
+        **fields: Named detail values; ``None`` values are skipped
+
+    Returns:
+        New details dict with the non-``None`` fields merged over ``details``
+    """
+    merged = dict(details or {})
+    merged.update((k, v) for k, v in fields.items() if v is not None)
+    return merged
+
+
+def _truncate(text: str, limit: int = 500) -> str:
+    """Truncate long strings (e.g. generated SQL) for error details.
+
+    Args:
+        text: String to truncate
+        limit: Maximum number of characters to keep
+
+    Returns:
+        The original string if short enough, otherwise a truncated copy
+    """
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
 class BaseWorkerException(Exception):
     """Base exception class for all worker service exceptions."""
 
@@ -69,23 +97,36 @@ class BaseWorkerException(Exception):
         self.error_code = error_code
         self.details = details or {}
         self.cause = cause
+        self._dict_cache: Optional[Dict[str, Any]] = None
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle via the constructor arguments instead of ``__dict__``.
+
+        Returns:
+            Callable and argument tuple used to rebuild the exception
+        """
+        return (
+            self.__class__,
+            (self.message, self.error_code, self.details, self.cause),
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary format.
 
+        The result is built once and cached; exceptions are treated as
+        immutable after they are raised.
+
         Returns:
             Dictionary representation of the exception
         """
-        result = {
-            "error_code": self.error_code.value,
-            "message": self.message,
-            "details": self.details,
-        }
-
-        if self.cause:
-            result["cause"] = str(self.cause)
-
-        return result
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "error_code": self.error_code.value,
+                "message": self.message,
+                "details": self.details,
+                **({"cause": str(self.cause)} if self.cause else {}),
+            }
+        return self._dict_cache
 
     def __str__(self) -> str:
         """String representation of the exception."""
@@ -110,11 +151,11 @@ class ValidationError(BaseWorkerException):
             value: Invalid value
             details: Additional details
         """
-        error_details = details or {}
-        if field:
-            error_details["field"] = field
-        if value is not None:
-            error_details["value"] = str(value)
+        error_details = _merge_details(
+            details,
+            field=field,
+            value=str(value) if value is not None else None,
+        )
 
         super().__init__(
             message=message,
@@ -124,6 +165,10 @@ class ValidationError(BaseWorkerException):
         self.field = field
         self.value = value
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle via the constructor arguments."""
+        return (self.__class__, (self.message, self.field, self.value, self.details))
+
 
 class ConfigurationError(BaseWorkerException):
     """Exception raised for configuration errors."""
@@ -141,9 +186,7 @@ class ConfigurationError(BaseWorkerException):
             config_key: Configuration key that caused the error
             details: Additional details
         """
-        error_details = details or {}
-        if config_key:
-            error_details["config_key"] = config_key
+        error_details = _merge_details(details, config_key=config_key)
 
         super().__init__(
             message=message,
@@ -152,6 +195,10 @@ class ConfigurationError(BaseWorkerException):
         )
         self.config_key = config_key
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle via the constructor arguments."""
+        return (self.__class__, (self.message, self.config_key, self.details))
+
 
 class AuthenticationError(BaseWorkerException):
     """Exception raised for authentication errors."""
@@ -171,6 +218,10 @@ class AuthenticationError(BaseWorkerException):
             message=message, error_code=ErrorCode.AUTHENTICATION_ERROR, details=details
         )
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle via the constructor arguments."""
+        return (self.__class__, (self.message, self.details))
+
 
 class AuthorizationError(BaseWorkerException):
     """Exception raised for authorization errors."""
@@ -190,11 +241,7 @@ class AuthorizationError(BaseWorkerException):
             action: Action being performed
             details: Additional details
         """
-        error_details = details or {}
-        if resource:
-            error_details["resource"] = resource
-        if action:
-            error_details["action"] = action
+        error_details = _merge_details(details, resource=resource, action=action)
 
         super().__init__(
             message=message,
@@ -204,6 +251,13 @@ class AuthorizationError(BaseWorkerException):
         self.resource = resource
         self.action = action
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle via the constructor arguments."""
+        return (
+            self.__class__,
+            (self.message, self.resource, self.action, self.details),
+        )
+
 
 class DataNotFoundError(BaseWorkerException):
     """Exception raised when requested data is not found."""
@@ -223,11 +277,11 @@ class DataNotFoundError(BaseWorkerException):
             resource_id: ID of resource not found
             details: Additional details
         """
-        error_details = details or {}
-        if resource_type:
-            error_details["resource_type"] = resource_type
-        if resource_id:
-            error_details["resource_id"] = resource_id
+        error_details = _merge_details(
+            details,
+            resource_type=resource_type,
+            resource_id=resource_id,
+        )
 
         super().__init__(
             message=message, error_code=ErrorCode.DATA_NOT_FOUND, details=error_details
@@ -235,6 +289,13 @@ class DataNotFoundError(BaseWorkerException):
         self.resource_type = resource_type
         self.resource_id = resource_id
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle via the constructor arguments."""
+        return (
+            self.__class__,
+            (self.message, self.resource_type, self.resource_id, self.details),
+        )
+
 
 class QueryError(BaseWorkerException):
     """Exception raised for query-related errors."""
@@ -254,14 +315,21 @@ class QueryError(BaseWorkerException):
             error_code: Specific error code
             details: Additional details
         """
-        error_details = details or {}
-        if query:
-            # Truncate long queries for logging
-            error_details["query"] = query[:500] + "..." if len(query) > 500 else query
+        error_details = _merge_details(
+            details,
+            query=_truncate(query) if query else None,
+        )
 
         super().__init__(message=message, error_code=error_code, details=error_details)
         self.query = query
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle via the constructor arguments."""
+        return (
+            self.__class__,
+            (self.message, self.query, self.error_code, self.details),
+        )
+
 
 class BigQueryError(BaseWorkerException):
     """Exception raised for BigQuery-specific errors."""
@@ -283,11 +351,11 @@ class BigQueryError(BaseWorkerException):
             details: Additional details
             cause: Original exception
         """
-        error_details = details or {}
-        if job_id:
-            error_details["job_id"] = job_id
-        if query:
-            error_details["query"] = query[:500] + "..." if len(query) > 500 else query
+        error_details = _merge_details(
+            details,
+            job_id=job_id,
+            query=_truncate(query) if query else None,
+        )
 
         super().__init__(
             message=message,
@@ -298,6 +366,13 @@ class BigQueryError(BaseWorkerException):
         self.job_id = job_id
         self.query = query
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle via the constructor arguments."""
+        return (
+            self.__class__,
+            (self.message, self.job_id, self.query, self.details, self.cause),
+        )
+
 
 class LookerError(BaseWorkerException):
     """Exception raised for Looker-specific errors."""
@@ -319,11 +394,11 @@ class LookerError(BaseWorkerException):
             details: Additional details
             cause: Original exception
         """
-        error_details = details or {}
-        if endpoint:
-            error_details["endpoint"] = endpoint
-        if status_code:
-            error_details["status_code"] = status_code
+        error_details = _merge_details(
+            details,
+            endpoint=endpoint,
+            status_code=status_code,
+        )
 
         super().__init__(
             message=message,
@@ -334,6 +409,13 @@ class LookerError(BaseWorkerException):
         self.endpoint = endpoint
         self.status_code = status_code
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle via the constructor arguments."""
+        return (
+            self.__class__,
+            (self.message, self.endpoint, self.status_code, self.details, self.cause),
+        )
+
 
 class LLMError(BaseWorkerException):
     """Exception raised for LLM-specific errors."""
@@ -355,11 +437,11 @@ class LLMError(BaseWorkerException):
             details: Additional details
             cause: Original exception
         """
-        error_details = details or {}
-        if model:
-            error_details["model"] = model
-        if prompt_length:
-            error_details["prompt_length"] = prompt_length
+        error_details = _merge_details(
+            details,
+            model=model,
+            prompt_length=prompt_length,
+        )
 
         super().__init__(
             message=message,
@@ -370,6 +452,13 @@ class LLMError(BaseWorkerException):
         self.model = model
         self.prompt_length = prompt_length
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle via the constructor arguments."""
+        return (
+            self.__class__,
+            (self.message, self.model, self.prompt_length, self.details, self.cause),
+        )
+
 
 class WorkflowError(BaseWorkerException):
     """Exception raised for workflow execution errors."""
@@ -391,11 +480,7 @@ class WorkflowError(BaseWorkerException):
             details: Additional details
             cause: Original exception
         """
-        error_details = details or {}
-        if workflow_id:
-            error_details["workflow_id"] = workflow_id
-        if step:
-            error_details["step"] = step
+        error_details = _merge_details(details, workflow_id=workflow_id, step=step)
 
         super().__init__(
             message=message,
@@ -406,6 +491,13 @@ class WorkflowError(BaseWorkerException):
         self.workflow_id = workflow_id
         self.step = step
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle via the constructor arguments."""
+        return (
+            self.__class__,
+            (self.message, self.workflow_id, self.step, self.details, self.cause),
+        )
+
 
 class AgentError(BaseWorkerException):
     """Exception raised for agent-specific errors."""
@@ -427,11 +519,11 @@ class AgentError(BaseWorkerException):
             details: Additional details
             cause: Original exception
         """
-        error_details = details or {}
-        if agent_id:
-            error_details["agent_id"] = agent_id
-        if agent_type:
-            error_details["agent_type"] = agent_type
+        error_details = _merge_details(
+            details,
+            agent_id=agent_id,
+            agent_type=agent_type,
+        )
 
         super().__init__(
             message=message,
@@ -442,6 +534,13 @@ class AgentError(BaseWorkerException):
         self.agent_id = agent_id
         self.agent_type = agent_type
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle via the constructor arguments."""
+        return (
+            self.__class__,
+            (self.message, self.agent_id, self.agent_type, self.details, self.cause),
+        )
+
 
 class ResourceError(BaseWorkerException):
     """Exception raised for resource-related errors."""
@@ -463,16 +562,29 @@ class ResourceError(BaseWorkerException):
             error_code: Specific error code
             details: Additional details
         """
-        error_details = details or {}
-        if resource_type:
-            error_details["resource_type"] = resource_type
-        if resource_id:
-            error_details["resource_id"] = resource_id
+        error_details = _merge_details(
+            details,
+            resource_type=resource_type,
+            resource_id=resource_id,
+        )
 
         super().__init__(message=message, error_code=error_code, details=error_details)
         self.resource_type = resource_type
         self.resource_id = resource_id
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle via the constructor arguments."""
+        return (
+            self.__class__,
+            (
+                self.message,
+                self.resource_type,
+                self.resource_id,
+                self.error_code,
+                self.details,
+            ),
+        )
+
 
 class TimeoutError(BaseWorkerException):
     """Exception raised for timeout errors."""
@@ -492,11 +604,11 @@ class TimeoutError(BaseWorkerException):
             operation: Operation that timed out
             details: Additional details
         """
-        error_details = details or {}
-        if timeout_seconds:
-            error_details["timeout_seconds"] = timeout_seconds
-        if operation:
-            error_details["operation"] = operation
+        error_details = _merge_details(
+            details,
+            timeout_seconds=timeout_seconds,
+            operation=operation,
+        )
 
         super().__init__(
             message=message, error_code=ErrorCode.TIMEOUT_ERROR, details=error_details
@@ -504,6 +616,13 @@ class TimeoutError(BaseWorkerException):
         self.timeout_seconds = timeout_seconds
         self.operation = operation
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle via the constructor arguments."""
+        return (
+            self.__class__,
+            (self.message, self.timeout_seconds, self.operation, self.details),
+        )
+
 
 class RateLimitError(BaseWorkerException):
     """Exception raised for rate limiting errors."""
@@ -523,11 +642,7 @@ class RateLimitError(BaseWorkerException):
             limit: Rate limit threshold
             details: Additional details
         """
-        error_details = details or {}
-        if retry_after:
-            error_details["retry_after"] = retry_after
-        if limit:
-            error_details["limit"] = limit
+        error_details = _merge_details(details, retry_after=retry_after, limit=limit)
 
         super().__init__(
             message=message,
@@ -537,6 +652,13 @@ class RateLimitError(BaseWorkerException):
         self.retry_after = retry_after
         self.limit = limit
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle via the constructor arguments."""
+        return (
+            self.__class__,
+            (self.message, self.retry_after, self.limit, self.details),
+        )
+
 
 def handle_exception(exc: Exception) -> BaseWorkerException:
     """Convert generic exceptions to worker exceptions.
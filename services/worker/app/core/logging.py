@@ -9,6 +9,55 @@ import json
 
 from .config import get_settings, LogLevel
 
+# Reduce verbosity of third-party libraries
+_THIRD_PARTY_LEVELS: Dict[str, int] = {
+    "google.cloud": logging.WARNING,
+    "google.auth": logging.WARNING,
+    "urllib3": logging.WARNING,
+    "requests": logging.WARNING,
+    "httpx": logging.WARNING,
+    "asyncio": logging.WARNING,
+    "aiohttp": logging.WARNING,
+    "redis": logging.WARNING,
+    "sqlalchemy": logging.WARNING,
+    "alembic": logging.WARNING,
+    "langgraph": logging.WARNING,
+    "langgraph.pregel": logging.WARNING,
+    "langgraph.pregel.utils": logging.WARNING,
+    "langchain": logging.WARNING,
+    "langchain_core": logging.WARNING,
+    "langchain_google_vertexai": logging.WARNING,
+    "numexpr": logging.WARNING,
+    "numexpr.utils": logging.WARNING,
+}
+
+# Application loggers kept at DEBUG in development
+_APP_LOGGERS = ("app", "worker", "agents", "tools", "workflows")
+
+# structlog processor chains; processors are stateless so they can be shared
+_JSON_PROCESSORS = (
+    structlog.stdlib.filter_by_level,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.UnicodeDecoder(),
+    structlog.processors.JSONRenderer(),
+)
+_CONSOLE_PROCESSORS = (
+    structlog.stdlib.filter_by_level,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.UnicodeDecoder(),
+    structlog.dev.ConsoleRenderer(colors=True),
+)
+
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
@@ -206,34 +255,12 @@ def configure_structlog(log_level: LogLevel, log_format: str) -> None:
         log_level: Logging level
         log_format: Log format preference
     """
-    # Determine processors based on format
-    if log_format.lower() == "json":
-        processors = [
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer(),
-        ]
-    else:
-        processors = [
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.dev.ConsoleRenderer(colors=True),
-        ]
+    processors = (
+        _JSON_PROCESSORS if log_format.lower() == "json" else _CONSOLE_PROCESSORS
+    )
 
     structlog.configure(
-        processors=processors,
+        processors=list(processors),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.stdlib.BoundLogger,
@@ -247,30 +274,8 @@ def configure_third_party_loggers(log_level: LogLevel) -> None:
     Args:
         log_level: Base logging level
     """
-    # Reduce verbosity of third-party libraries
-    third_party_loggers = {
-        "google.cloud": logging.WARNING,
-        "google.auth": logging.WARNING,
-        "urllib3": logging.WARNING,
-        "requests": logging.WARNING,
-        "httpx": logging.WARNING,
-        "asyncio": logging.WARNING,
-        "aiohttp": logging.WARNING,
-        "redis": logging.WARNING,
-        "sqlalchemy": logging.WARNING,
-        "alembic": logging.WARNING,
-        "langgraph": logging.WARNING,
-        "langgraph.pregel": logging.WARNING,
-        "langgraph.pregel.utils": logging.WARNING,
-        "langchain": logging.WARNING,
-        "langchain_core": logging.WARNING,
-        "langchain_google_vertexai": logging.WARNING,
-        "numexpr": logging.WARNING,
-        "numexpr.utils": logging.WARNING,
-    }
-
     # Set levels for third-party loggers
-    for logger_name, level in third_party_loggers.items():
+    for logger_name, level in _THIRD_PARTY_LEVELS.items():
         logger = logging.getLogger(logger_name)
         # Only set if current level is more verbose
         if logger.level < level:
@@ -280,9 +285,7 @@ def configure_third_party_loggers(log_level: LogLevel) -> None:
     settings = get_settings()
     if settings.is_development and log_level == LogLevel.DEBUG:
         # Keep our application loggers at DEBUG level
-        app_loggers = ["app", "worker", "agents", "tools", "workflows"]
-
-        for logger_name in app_loggers:
+        for logger_name in _APP_LOGGERS:
             logger = logging.getLogger(logger_name)
             logger.setLevel(logging.DEBUG)
 
@@ -299,6 +302,40 @@ def get_logger(name: str) -> structlog.BoundLogger:
     return structlog.get_logger(name)
 
 
+def get_fast_logger(name: str) -> Any:
+    """Get a native structlog logger that bypasses stdlib logging.
+
+    Intended for hot paths such as request logging. Calls below the configured
+    level are dropped before any processor runs, and rendered events are
+    written straight to stdout instead of going through stdlib handlers.
+
+    Args:
+        name: Logger name
+
+    Returns:
+        Filtering structlog logger bound to ``name``
+    """
+    settings = get_settings()
+    if settings.log_format.lower() == "json":
+        renderer: Any = structlog.processors.JSONRenderer()
+    else:
+        renderer = structlog.dev.ConsoleRenderer(colors=True)
+
+    return structlog.wrap_logger(
+        structlog.WriteLogger(sys.stdout),
+        processors=[
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            renderer,
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(
+            getattr(logging, settings.log_level.value)
+        ),
+        context_class=dict,
+        cache_logger_on_first_use=True,
+    ).bind(logger=name)
+
+
 def add_context(**kwargs: Any) -> None:
     """Add context to all subsequent log messages in this thread.
 
@@ -336,7 +373,7 @@ class RequestLogger:
         Args:
             logger_name: Name for the logger
         """
-        self.logger = get_logger(logger_name)
+        self.logger = get_fast_logger(logger_name)
 
     def log_request(
         self,
@@ -1,15 +1,145 @@
 """外部记忆存储管理"""
 
+import hashlib
 import json
+import mmap
 import os
+import sqlite3
+import tempfile
+import time
 import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from contextlib import closing, contextmanager, suppress
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
+import msgpack
 import structlog
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
+
 logger = structlog.get_logger()
 
+# 会话ID -> [(记忆键值, 修改时间)]
+_SessionIndex = Dict[str, List[Tuple[str, float]]]
+
+# 存储格式版本；版本2起记忆文件使用MessagePack二进制编码，
+# 并以整数纳秒记录写入时间（timestamp_ns）
+_STORAGE_VERSION = 2
+# 新写入记忆文件使用的后缀，及读取时依次尝试的后缀（.json 为版本1的旧文件）
+_MEMORY_SUFFIX = ".msgpack"
+_MEMORY_SUFFIXES = (".msgpack", ".json")
+# 按内容哈希缓存的结果统一记录在该会话ID下
+_CACHE_SESSION_ID = "cache"
+# 进程内检索结果缓存的总字节上限（按编码后大小计）
+_READ_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+
+def _dumps(obj: Any, suffix: str = _MEMORY_SUFFIX) -> bytes:
+    """按文件格式序列化数据，JSON优先使用orjson"""
+    if suffix == ".msgpack":
+        return msgpack.packb(obj, use_bin_type=True)
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _loads(data: Any, suffix: str) -> Any:
+    """按文件格式反序列化字节数据，JSON优先使用orjson"""
+    if suffix == ".msgpack":
+        # 允许非字符串键，如 DataFrame.to_dict() 生成的 {列: {0: ..., 1: ...}}
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+
+def _load_file(file_path: str, suffix: str) -> Any:
+    """通过内存映射读取并反序列化文件，避免整文件复制到堆内存"""
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return _loads(b"", suffix)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return _loads(view, suffix)
+
+
+def _iter_encoded(obj: Any, suffix: str = _MEMORY_SUFFIX) -> Iterator[bytes]:
+    """逐块序列化数据；列表按元素分块编码，峰值内存只取决于单个元素大小
+
+    Args:
+        obj: 要序列化的数据
+        suffix: 文件格式后缀
+
+    Yields:
+        编码后的字节块，依次拼接即为完整文档
+    """
+    if not isinstance(obj, list):
+        yield _dumps(obj, suffix)
+        return
+
+    if suffix == ".msgpack":
+        packer = msgpack.Packer(use_bin_type=True)
+        yield packer.pack_array_header(len(obj))
+        for item in obj:
+            yield packer.pack(item)
+        return
+
+    yield b"["
+    for index, item in enumerate(obj):
+        if index:
+            yield b","
+        if orjson is not None:
+            yield orjson.dumps(
+                item, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        else:
+            yield json.dumps(item, ensure_ascii=False).encode("utf-8")
+    yield b"]"
+
+
+def _write_atomic(
+    file_path: str, chunks: Iterable[bytes], drop_cache: bool = False
+) -> int:
+    """先写临时文件再原子替换，读者不会看到写了一半的文件
+
+    Args:
+        file_path: 目标文件路径
+        chunks: 要依次写入的字节块
+        drop_cache: 写完后是否建议内核丢弃该文件的页缓存（用于大文件）
+
+    Returns:
+        写入的总字节数
+    """
+    # 每次写入使用独立的临时文件，并发写同一路径时互不覆盖
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(file_path),
+        prefix=f"{os.path.basename(file_path)}.",
+        suffix=".tmp",
+    )
+    try:
+        size = 0
+        with open(fd, "wb", buffering=1024 * 1024) as f:
+            for chunk in chunks:
+                size += f.write(chunk)
+            if drop_cache and hasattr(os, "posix_fadvise"):
+                f.flush()
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        # 写入失败时清理临时文件，不留下残片
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+    return size
+
 
 class ExternalMemory:
     """外部记忆存储管理器"""
@@ -21,7 +151,13 @@ class ExternalMemory:
             storage_dir: 存储目录路径
         """
         self.storage_dir = storage_dir
+        self.index_path = os.path.join(storage_dir, "sessions.db")
+        # (记忆键值, 文件mtime_ns) -> MessagePack编码的数据；文件变化后键自然失效。
+        # 缓存编码后的字节而非对象，每次命中解码出独立副本，调用方修改结果不会污染缓存
+        self._read_cache: OrderedDict[Tuple[str, int], bytes] = OrderedDict()
+        self._read_cache_bytes = 0
         os.makedirs(storage_dir, exist_ok=True)
+        self._init_index()
         logger.info("外部记忆存储初始化", storage_dir=storage_dir)
 
     def store_analysis_result(self, session_id: str, data: Dict[str, Any]) -> str:
@@ -34,19 +170,69 @@ class ExternalMemory:
         Returns:
             存储键值
         """
-        memory_key = f"{session_id}_{uuid.uuid4().hex[:8]}"
-        file_path = os.path.join(self.storage_dir, f"{memory_key}.json")
+        memory_key = self._new_memory_key(session_id)
+        return self._write_memory(session_id, memory_key, data)
+
+    def _new_memory_key(self, session_id: str) -> str:
+        """生成新的记忆键值"""
+        return f"{session_id}_{uuid.uuid4().hex[:8]}"
+
+    def _shard_path(self, memory_key: str, suffix: str) -> str:
+        """计算记忆文件的分片存储路径
+
+        文件按会话ID的哈希分散到256个子目录中，避免单一目录过大。
+
+        Args:
+            memory_key: 存储键值
+            suffix: 文件后缀
+
+        Returns:
+            分片目录下的文件路径
+        """
+        session_id = memory_key.rsplit("_", 1)[0]
+        bucket = hashlib.blake2b(session_id.encode("utf-8"), digest_size=1).hexdigest()
+        return os.path.join(self.storage_dir, bucket, f"{memory_key}{suffix}")
+
+    def _find_memory_file(self, memory_key: str, suffix: str) -> str:
+        """查找记忆文件路径，兼容分片前直接存放在根目录的旧文件"""
+        legacy_path = os.path.join(self.storage_dir, f"{memory_key}{suffix}")
+        if os.path.exists(legacy_path):
+            return legacy_path
+        return self._shard_path(memory_key, suffix)
+
+    def _write_memory(
+        self, session_id: str, memory_key: str, data: Dict[str, Any]
+    ) -> str:
+        """将数据写入记忆文件
+
+        Args:
+            session_id: 会话ID
+            memory_key: 存储键值
+            data: 要存储的数据
+
+        Returns:
+            存储键值
+        """
+        file_path = self._shard_path(memory_key, _MEMORY_SUFFIX)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
+        now_ns = time.time_ns()
         storage_data = {
+            "version": _STORAGE_VERSION,
             "session_id": session_id,
             "memory_key": memory_key,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": now_ns,
             "data": data,
         }
 
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(storage_data, f, ensure_ascii=False, indent=2)
+            _write_atomic(file_path, (_dumps(storage_data),))
+
+            with self._index() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO mem VALUES (?, ?, ?)",
+                    (memory_key, session_id, now_ns / 1e9),
+                )
 
             logger.info("分析结果已存储到外部记忆", memory_key=memory_key)
             return memory_key
@@ -64,23 +250,57 @@ class ExternalMemory:
         Returns:
             检索到的数据，如果不存在则返回None
         """
-        file_path = os.path.join(self.storage_dir, f"{memory_key}.json")
-
-        if not os.path.exists(file_path):
+        for suffix in _MEMORY_SUFFIXES:
+            file_path = self._find_memory_file(memory_key, suffix)
+            if os.path.exists(file_path):
+                break
+        else:
             logger.warning("外部记忆文件不存在", memory_key=memory_key)
             return None
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                storage_data = json.load(f)
+            cache_key = (memory_key, os.stat(file_path).st_mtime_ns)
+            cached = self._read_cache.get(cache_key)
+            if cached is not None:
+                self._read_cache.move_to_end(cache_key)
+                logger.info("从外部记忆缓存检索数据成功", memory_key=memory_key)
+                return _loads(cached, ".msgpack")
+
+            storage_data = _load_file(file_path, suffix)
+
+            data = storage_data["data"]
+            payload_file = data.get("full_data_file")
+            if payload_file:
+                # 大型结果的完整数据存放在旁路文件中，编码与记忆文件一致；
+                # 这类结果不进入缓存，避免常驻内存
+                data["full_data"] = _load_file(
+                    os.path.join(os.path.dirname(file_path), payload_file), suffix
+                )
+            else:
+                self._cache_read(cache_key, _dumps(data, ".msgpack"))
 
             logger.info("从外部记忆检索数据成功", memory_key=memory_key)
-            return storage_data["data"]
+            return data
 
         except Exception as e:
             logger.error("检索外部记忆失败", error=str(e), memory_key=memory_key)
             return None
 
+    def _cache_read(self, cache_key: Tuple[str, int], encoded: bytes) -> None:
+        """缓存检索结果，超出总字节上限时淘汰最久未使用的条目
+
+        Args:
+            cache_key: (记忆键值, 文件mtime_ns)
+            encoded: MessagePack编码的数据
+        """
+        if len(encoded) > _READ_CACHE_MAX_BYTES:
+            return
+        self._read_cache[cache_key] = encoded
+        self._read_cache_bytes += len(encoded)
+        while self._read_cache_bytes > _READ_CACHE_MAX_BYTES:
+            _, evicted = self._read_cache.popitem(last=False)
+            self._read_cache_bytes -= len(evicted)
+
     def list_session_memories(self, session_id: str) -> List[str]:
         """列出会话的所有记忆键值
 
@@ -90,13 +310,15 @@ class ExternalMemory:
         Returns:
             记忆键值列表
         """
-        memory_keys = []
-
         try:
-            for filename in os.listdir(self.storage_dir):
-                if filename.startswith(f"{session_id}_") and filename.endswith(".json"):
-                    memory_key = filename[:-5]  # 移除.json后缀
-                    memory_keys.append(memory_key)
+            with self._index() as conn:
+                memory_keys = [
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT memory_key FROM mem WHERE session_id = ?",
+                        (session_id,),
+                    )
+                ]
 
             logger.info("列出会话记忆", session_id=session_id, count=len(memory_keys))
             return memory_keys
@@ -105,6 +327,59 @@ class ExternalMemory:
             logger.error("列出会话记忆失败", error=str(e), session_id=session_id)
             return []
 
+    @contextmanager
+    def _index(self) -> Iterator[sqlite3.Connection]:
+        """打开会话索引连接，正常退出时提交事务"""
+        with closing(sqlite3.connect(self.index_path)) as conn:
+            with conn:
+                yield conn
+
+    def _init_index(self) -> None:
+        """创建会话索引，首次创建时从已有记忆文件回填"""
+        is_new = not os.path.exists(self.index_path)
+        with self._index() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS mem ("
+                "memory_key TEXT PRIMARY KEY, session_id TEXT NOT NULL, "
+                "timestamp REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS mem_session ON mem (session_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS mem_timestamp ON mem (timestamp)")
+            if is_new:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO mem VALUES (?, ?, ?)",
+                    (
+                        (memory_key, session_id, mtime)
+                        for session_id, entries in self._scan_storage().items()
+                        for memory_key, mtime in entries
+                    ),
+                )
+
+    def _scan_storage(self) -> _SessionIndex:
+        """扫描存储目录并按会话分组
+
+        Returns:
+            会话ID到(记忆键值, 修改时间)列表的映射
+        """
+        sessions: _SessionIndex = {}
+        pending = [self.storage_dir]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        pending.append(entry.path)
+                        continue
+                    memory_key, suffix = os.path.splitext(entry.name)
+                    if suffix not in _MEMORY_SUFFIXES:
+                        continue
+                    session_id = memory_key.rsplit("_", 1)[0]
+                    sessions.setdefault(session_id, []).append(
+                        (memory_key, entry.stat().st_mtime)
+                    )
+
+        return sessions
+
     def cleanup_old_memories(self, days_old: int = 7) -> int:
         """清理过期的记忆文件
 
@@ -115,17 +390,27 @@ class ExternalMemory:
             清理的文件数量
         """
         cleaned_count = 0
-        cutoff_time = datetime.now().timestamp() - (days_old * 24 * 60 * 60)
+        cutoff_time = time.time() - (days_old * 24 * 60 * 60)
 
         try:
-            for filename in os.listdir(self.storage_dir):
-                if filename.endswith(".json"):
-                    file_path = os.path.join(self.storage_dir, filename)
-                    file_time = os.path.getmtime(file_path)
-
-                    if file_time < cutoff_time:
-                        os.remove(file_path)
-                        cleaned_count += 1
+            with self._index() as conn:
+                expired = [
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT memory_key FROM mem WHERE timestamp < ?",
+                        (cutoff_time,),
+                    )
+                ]
+                for memory_key in expired:
+                    for suffix in (*_MEMORY_SUFFIXES, ".bin"):
+                        file_path = self._find_memory_file(memory_key, suffix)
+                        if os.path.exists(file_path):
+                            os.remove(file_path)
+                            cleaned_count += 1
+                conn.executemany(
+                    "DELETE FROM mem WHERE memory_key = ?",
+                    ((memory_key,) for memory_key in expired),
+                )
 
             logger.info(
                 "清理过期记忆完成", cleaned_count=cleaned_count, days_old=days_old
@@ -136,6 +421,36 @@ class ExternalMemory:
             logger.error("清理过期记忆失败", error=str(e))
             return 0
 
+    def store_cached_result(self, cache_key: str, data: Dict[str, Any]) -> str:
+        """按确定性的缓存键存储结果，如提示词哈希对应的LLM响应
+
+        Args:
+            cache_key: 缓存键（如SHA-256摘要）
+            data: 要缓存的数据
+
+        Returns:
+            存储键值
+        """
+        memory_key = f"{_CACHE_SESSION_ID}_{cache_key}"
+        return self._write_memory(_CACHE_SESSION_ID, memory_key, data)
+
+    def retrieve_cached_result(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """检索按缓存键存储的结果，未命中时静默返回None
+
+        Args:
+            cache_key: 缓存键
+
+        Returns:
+            缓存的数据，未命中则返回None
+        """
+        memory_key = f"{_CACHE_SESSION_ID}_{cache_key}"
+        if not any(
+            os.path.exists(self._find_memory_file(memory_key, suffix))
+            for suffix in _MEMORY_SUFFIXES
+        ):
+            return None
+        return self.retrieve_analysis_result(memory_key)
+
     def store_large_result(
         self, session_id: str, result_data: Any, summary: str
     ) -> str:
@@ -149,11 +464,21 @@ class ExternalMemory:
         Returns:
             存储键值
         """
+        memory_key = self._new_memory_key(session_id)
+
+        # 完整数据边序列化边写入旁路文件，元数据中记录其字节大小
+        payload_file = f"{memory_key}.bin"
+        payload_path = self._shard_path(memory_key, ".bin")
+        os.makedirs(os.path.dirname(payload_path), exist_ok=True)
+        payload_size = _write_atomic(
+            payload_path, _iter_encoded(result_data), drop_cache=True
+        )
+
         data = {
             "type": "large_result",
             "summary": summary,
-            "full_data": result_data,
-            "size": len(str(result_data)),
+            "full_data_file": payload_file,
+            "size": payload_size,
         }
 
-        return self.store_analysis_result(session_id, data)
+        return self._write_memory(session_id, memory_key, data)
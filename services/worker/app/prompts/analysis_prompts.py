@@ -1,5 +1,8 @@
 """数据分析相关的提示词模板"""
 
+from string import Formatter
+from typing import Callable
+
 # 任务安全过滤提示词
 TASK_SAFETY_FILTER_PROMPT = """
 你是一个SQL安全过滤器。你的任务是分析用户输入的数据分析需求，确保它只包含安全的读取操作。
@@ -92,3 +95,64 @@ SQL查询执行失败，请分析错误并提供修复建议。
     "confidence": "修复成功的信心度(0-1)"
 }}
 """
+
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """预解析提示词模板，返回渲染函数
+
+    模板在导入时只解析一次，渲染时直接拼接字面量和字段值，
+    避免每次调用 ``str.format`` 都重新解析格式串。
+
+    Args:
+        template: ``str.format`` 风格的模板
+
+    Returns:
+        以关键字参数渲染模板的函数
+    """
+    parts = tuple(
+        (literal, field, spec or "")
+        for literal, field, spec, _ in Formatter().parse(template)
+    )
+
+    def render(**kwargs: object) -> str:
+        chunks = []
+        for literal, field, spec in parts:
+            chunks.append(literal)
+            if field is not None:
+                chunks.append(format(kwargs[field], spec))
+        return "".join(chunks)
+
+    return render
+
+
+_render_task_safety_filter = _compile_template(TASK_SAFETY_FILTER_PROMPT)
+_render_intent_analysis = _compile_template(INTENT_ANALYSIS_PROMPT)
+_render_analysis_report = _compile_template(ANALYSIS_REPORT_PROMPT)
+_render_error_analysis = _compile_template(ERROR_ANALYSIS_PROMPT)
+
+
+def render_task_safety_filter(user_task: str) -> str:
+    """渲染任务安全过滤提示词"""
+    return _render_task_safety_filter(user_task=user_task)
+
+
+def render_intent_analysis(user_task: str, table_schemas: str) -> str:
+    """渲染意图分析和SQL生成提示词"""
+    return _render_intent_analysis(user_task=user_task, table_schemas=table_schemas)
+
+
+def render_analysis_report(user_task: str, query_results: str) -> str:
+    """渲染结果分析和报告生成提示词"""
+    return _render_analysis_report(user_task=user_task, query_results=query_results)
+
+
+def render_error_analysis(
+    user_task: str, failed_sql: str, error_message: str, table_schemas: str
+) -> str:
+    """渲染错误处理和重试提示词"""
+    return _render_error_analysis(
+        user_task=user_task,
+        failed_sql=failed_sql,
+        error_message=error_message,
+        table_schemas=table_schemas,
+    )
@@ -2,19 +2,52 @@
 
 该模块包含用于BigQuery数据操作的各种工具，专为LangGraph工作流设计。
 基于Thrasio IQ企业级多Agent系统的BigQuery x Looker数据分析Agent需求开发。
+
+子模块在首次访问对应名称时才导入（PEP 562），避免导入本包就加载
+pandas、google-cloud-bigquery 等重量级依赖。
 """
 
-from .client import BigQueryClient
-from .dataset_explorer import BigQueryDatasetExplorer
-from .query_builder import QueryBuilder
-from .query_executor import BigQueryQueryExecutor, create_query_executor
-from .schema_manager import SchemaManager
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import BigQueryClient, get_shared_client
+    from .dataset_explorer import BigQueryDatasetExplorer
+    from .query_builder import QueryBuilder
+    from .query_executor import BigQueryQueryExecutor, create_query_executor
+    from .schema_manager import SchemaManager
+
+# 公开名称 -> 所在子模块
+_LAZY_IMPORTS = {
+    "BigQueryClient": "client",
+    "get_shared_client": "client",
+    "BigQueryDatasetExplorer": "dataset_explorer",
+    "QueryBuilder": "query_builder",
+    "BigQueryQueryExecutor": "query_executor",
+    "create_query_executor": "query_executor",
+    "SchemaManager": "schema_manager",
+}
 
 __all__ = [
     "BigQueryClient",
+    "get_shared_client",
     "BigQueryDatasetExplorer",
     "QueryBuilder",
     "BigQueryQueryExecutor",
     "create_query_executor",
     "SchemaManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # 缓存到模块命名空间，后续访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -1,14 +1,55 @@
 """BigQuery client wrapper for data analysis."""
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+import copy
+import hashlib
 import os
 import json
+import threading
+import time
+from datetime import date, datetime, timezone
 import pandas as pd
 import structlog
+from requests.adapters import HTTPAdapter
 from google.cloud import bigquery
 from google.cloud.bigquery import QueryJobConfig, ScalarQueryParameter, ArrayQueryParameter
 from google.api_core.exceptions import GoogleAPIError
 
+try:
+    from google.cloud import bigquery_storage
+except ImportError:  # Optional: falls back to the REST tabledata.list API
+    bigquery_storage = None
+
+# Metadata (datasets, tables, schemas) rarely changes during an analysis session
+METADATA_CACHE_TTL = 300
+METADATA_CACHE_MAXSIZE = 512
+
+# HTTP connections kept per host; the client is shared across agents and
+# threads, and requests' default of 10 drops connections under load
+HTTP_POOL_SIZE = 20
+
+# Column listings for more tables than this are downloaded via the Storage Read API
+BQSTORAGE_MIN_TABLES = 20
+
+# Python type -> BigQuery parameter type; bool is listed before its base int
+_SCALAR_TYPES: Dict[type, str] = {
+    bool: "BOOL",
+    int: "INT64",
+    float: "FLOAT64",
+    str: "STRING",
+    datetime: "DATETIME",  # TIMESTAMP when timezone-aware; listed before its base date
+    date: "DATE",
+    type(None): "STRING",
+}
+
+# Standard SQL type names as reported by INFORMATION_SCHEMA -> legacy API names
+_LEGACY_FIELD_TYPES = {
+    "INT64": "INTEGER",
+    "FLOAT64": "FLOAT",
+    "BOOL": "BOOLEAN",
+    "STRUCT": "RECORD",
+}
+
 
 class BigQueryClient:
     """Wrapper for Google BigQuery client with enhanced functionality."""
@@ -34,6 +75,18 @@ class BigQueryClient:
         else:
             # Use default credentials
             self.client = bigquery.Client(project=self.project_id)
+        
+        # Reuse up to HTTP_POOL_SIZE keep-alive connections to the BigQuery API
+        self.client._http.mount(
+            "https://",
+            HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        )
+            
+        # (method, *args) -> (expires_at, value)
+        self._metadata_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        self._metadata_lock = threading.Lock()
+        # Created lazily and reused for every query result download
+        self._bqstorage_client: Optional[Any] = None
             
         self.logger.info("BigQuery client initialized", project_id=self.project_id)
     
@@ -43,8 +96,9 @@ class BigQueryClient:
         params: Optional[Dict[str, Any]] = None,
         timeout: Optional[float] = None,
         dry_run: bool = False,
-        max_results: Optional[int] = None
-    ) -> pd.DataFrame:
+        max_results: Optional[int] = None,
+        return_format: Literal["dataframe", "arrow", "dict", "iter"] = "dataframe"
+    ) -> Any:
         """Execute a BigQuery SQL query and return results as DataFrame.
         
         Args:
@@ -52,10 +106,19 @@ class BigQueryClient:
             params: Query parameters dict
             timeout: Query timeout in seconds
             dry_run: If True, don't actually run the query
-            max_results: Maximum number of results to return
+            max_results: Maximum number of rows to fetch. This is an authoritative
+                cap applied while paging: rows past it are never downloaded.
+                Capped results come back as a single REST page of at most
+                max_results rows; only uncapped results are downloaded through
+                the Storage Read API, which cannot honour the cap
+            return_format: Result representation. "dataframe" (default) builds a
+                pandas DataFrame; "arrow" returns a pyarrow Table; "dict" returns a
+                list of row dicts and "iter" the lazy RowIterator, both skipping
+                pandas entirely
             
         Returns:
-            Pandas DataFrame with query results
+            Query results in the requested format. Dry runs return an empty
+            DataFrame, or an empty list for the other formats
             
         Raises:
             GoogleAPIError: If query execution fails
@@ -68,15 +131,7 @@ class BigQueryClient:
         
         # Set query parameters if provided
         if params:
-            query_params = []
-            for name, value in params.items():
-                if isinstance(value, list):
-                    param = ArrayQueryParameter(name, self._get_array_type(value), value)
-                else:
-                    param = ScalarQueryParameter(name, self._get_scalar_type(value), value)
-                query_params.append(param)
-            
-            job_config.query_parameters = query_params
+            job_config.query_parameters = self._build_query_params(params)
         
         try:
             self.logger.info("Executing BigQuery query", query_length=len(query))
@@ -88,22 +143,49 @@ class BigQueryClient:
                     "Dry run completed", 
                     bytes_processed=query_job.total_bytes_processed
                 )
-                return pd.DataFrame()
+                return pd.DataFrame() if return_format == "dataframe" else []
             
             # Wait for query to complete and fetch results
-            results = query_job.result(timeout=timeout, max_results=max_results)
+            # A capped result is fetched over REST in a single page of at most
+            # max_results rows, which also rules out the Storage Read API below
+            results = query_job.result(
+                timeout=timeout, max_results=max_results, page_size=max_results
+            )
             
-            # Convert to DataFrame
-            df = results.to_dataframe()
+            if return_format == "iter":
+                # Rows are fetched lazily as the caller iterates
+                output: Any = results
+                row_count = results.total_rows
+            elif return_format == "dict":
+                output = [dict(row.items()) for row in results]
+                row_count = len(output)
+            else:
+                # The Storage Read API cannot honour max_results, so capped
+                # results are downloaded through the REST endpoint
+                bqstorage_client = (
+                    self._get_bqstorage_client() if max_results is None else None
+                )
+                if return_format == "arrow":
+                    output = results.to_arrow(
+                        bqstorage_client=bqstorage_client,
+                        create_bqstorage_client=False
+                    )
+                    row_count = output.num_rows
+                else:
+                    output = results.to_dataframe(
+                        bqstorage_client=bqstorage_client,
+                        create_bqstorage_client=False
+                    )
+                    row_count = len(output)
                 
             self.logger.info(
                 "Query executed successfully",
-                rows=len(df),
+                rows=row_count,
                 bytes_processed=query_job.total_bytes_processed,
                 billing_tier=query_job.billing_tier
             )
             
-            return df
+            return output
             
         except GoogleAPIError as e:
             self.logger.error(
@@ -113,7 +195,75 @@ class BigQueryClient:
             )
             raise
 
+    def estimate_query_bytes(self, query: str, timeout: Optional[float] = None) -> int:
+        """Estimate the bytes a query would scan, via a cached dry run.
+        
+        Repeated estimates for the same query (ignoring surrounding whitespace)
+        are served from the metadata cache instead of issuing another dry run.
+        
+        Args:
+            query: SQL query string
+            timeout: Dry-run request timeout in seconds
+            
+        Returns:
+            Estimated number of bytes processed
+            
+        Raises:
+            GoogleAPIError: If the dry run fails (e.g. the query is invalid)
+        """
+        normalized = query.strip()
+        digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+        return self._cached(
+            ("estimate_query_bytes", digest),
+            lambda: self._dry_run_bytes(normalized, timeout),
+        )
+    
+    def _dry_run_bytes(self, query: str, timeout: Optional[float]) -> int:
+        """Run a dry-run query job and return its bytes-processed estimate."""
+        job_config = QueryJobConfig(dry_run=True, use_query_cache=False)
+        try:
+            query_job = self.client.query(query, job_config=job_config, timeout=timeout)
+        except GoogleAPIError as e:
+            self.logger.error(
+                "BigQuery dry run failed",
+                error=str(e),
+                query_length=len(query)
+            )
+            raise
+        bytes_processed = query_job.total_bytes_processed or 0
+        self.logger.info("Dry run completed", bytes_processed=bytes_processed)
+        return bytes_processed
+
+    def _get_bqstorage_client(self) -> Optional[Any]:
+        """Get the shared BigQuery Storage read client, if installed.
+        
+        Returns:
+            BigQueryReadClient instance, or None when google-cloud-bigquery-storage
+            is not available
+        """
+        if bigquery_storage is None:
+            return None
+        if self._bqstorage_client is None:
+            self._bqstorage_client = bigquery_storage.BigQueryReadClient(
+                credentials=self.client._credentials
+            )
+        return self._bqstorage_client
+
     def get_dataset_info(self, dataset_id: str) -> Dict[str, Any]:
+        """Get detailed information about a dataset (cached).
+        
+        Args:
+            dataset_id: BigQuery dataset ID
+            
+        Returns:
+            Dictionary with dataset metadata
+        """
+        return self._cached(
+            ("get_dataset_info", dataset_id),
+            lambda: self._fetch_dataset_info(dataset_id),
+        )
+    
+    def _fetch_dataset_info(self, dataset_id: str) -> Dict[str, Any]:
         """Get detailed information about a dataset.
         
         Args:
@@ -151,6 +301,21 @@ class BigQueryClient:
             raise
     
     def get_table_schema(self, dataset_id: str, table_id: str) -> List[Dict[str, Any]]:
+        """Get schema for a BigQuery table (cached).
+        
+        Args:
+            dataset_id: BigQuery dataset ID
+            table_id: BigQuery table ID
+            
+        Returns:
+            List of schema field definitions
+        """
+        return self._cached(
+            ("get_table_schema", dataset_id, table_id),
+            lambda: self._fetch_table_schema(dataset_id, table_id),
+        )
+    
+    def _fetch_table_schema(self, dataset_id: str, table_id: str) -> List[Dict[str, Any]]:
         """Get schema for a BigQuery table.
         
         Args:
@@ -196,6 +361,17 @@ class BigQueryClient:
             raise
     
     def list_datasets(self) -> List[str]:
+        """List all datasets in the project (cached).
+        
+        Returns:
+            List of dataset IDs
+        """
+        return self._cached(
+            ("list_datasets",),
+            self._fetch_datasets,
+        )
+    
+    def _fetch_datasets(self) -> List[str]:
         """List all datasets in the project.
         
         Returns:
@@ -213,6 +389,20 @@ class BigQueryClient:
             raise
     
     def list_tables(self, dataset_id: str) -> List[str]:
+        """List all tables in a dataset (cached).
+        
+        Args:
+            dataset_id: BigQuery dataset ID
+            
+        Returns:
+            List of table IDs
+        """
+        return self._cached(
+            ("list_tables", dataset_id),
+            lambda: self._fetch_tables(dataset_id),
+        )
+    
+    def _fetch_tables(self, dataset_id: str) -> List[str]:
         """List all tables in a dataset.
         
         Args:
@@ -241,7 +431,80 @@ class BigQueryClient:
             )
             raise
     
+    def list_tables_by_prefix(
+        self, dataset_id: str, prefix: str, limit: Optional[int] = None
+    ) -> List[str]:
+        """List tables whose name starts with a prefix (cached).
+        
+        The prefix filter and limit are evaluated by BigQuery via
+        INFORMATION_SCHEMA.TABLES, so non-matching tables are never listed.
+        
+        Args:
+            dataset_id: BigQuery dataset ID
+            prefix: Case-insensitive table name prefix
+            limit: Maximum number of table IDs to return
+            
+        Returns:
+            List of table IDs ordered by name
+        """
+        return self._cached(
+            ("list_tables_by_prefix", dataset_id, prefix, limit),
+            lambda: self._fetch_tables_by_prefix(dataset_id, prefix, limit),
+        )
+    
+    def _fetch_tables_by_prefix(
+        self, dataset_id: str, prefix: str, limit: Optional[int]
+    ) -> List[str]:
+        """List tables whose name starts with a prefix via INFORMATION_SCHEMA."""
+        query = f"""
+            SELECT table_name
+            FROM `{self.project_id}.{dataset_id}.INFORMATION_SCHEMA.TABLES`
+            WHERE STARTS_WITH(LOWER(table_name), @prefix)
+            ORDER BY table_name
+        """
+        query_params = [ScalarQueryParameter("prefix", "STRING", prefix.lower())]
+        if limit is not None:
+            query += "LIMIT @limit"
+            query_params.append(ScalarQueryParameter("limit", "INT64", limit))
+        
+        try:
+            job_config = QueryJobConfig(query_parameters=query_params)
+            rows = self.client.query(query, job_config=job_config).result()
+            table_ids = [row.table_name for row in rows]
+            
+            self.logger.info(
+                "Listed tables by prefix",
+                dataset=dataset_id,
+                prefix=prefix,
+                count=len(table_ids)
+            )
+            return table_ids
+            
+        except GoogleAPIError as e:
+            self.logger.error(
+                "Failed to list tables by prefix",
+                error=str(e),
+                dataset=dataset_id,
+                prefix=prefix
+            )
+            raise
+    
     def get_table_info(self, dataset_id: str, table_id: str) -> Dict[str, Any]:
+        """Get detailed information about a table (cached).
+        
+        Args:
+            dataset_id: BigQuery dataset ID
+            table_id: BigQuery table ID
+            
+        Returns:
+            Dictionary with table metadata
+        """
+        return self._cached(
+            ("get_table_info", dataset_id, table_id),
+            lambda: self._fetch_table_info(dataset_id, table_id),
+        )
+    
+    def _fetch_table_info(self, dataset_id: str, table_id: str) -> Dict[str, Any]:
         """Get detailed information about a table.
         
         Args:
@@ -290,6 +553,231 @@ class BigQueryClient:
             )
             raise
     
+    def get_tables_info(
+        self,
+        dataset_id: str,
+        table_ids: Optional[List[str]],
+        include_schema: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Get detailed information for many tables at once (cached).
+        
+        Uses INFORMATION_SCHEMA instead of one get_table call per table.
+        
+        Args:
+            dataset_id: BigQuery dataset ID
+            table_ids: BigQuery table IDs, or None for every table in the dataset
+            include_schema: Also fetch column schemas; when False the COLUMNS
+                query is skipped and the "schema" key is omitted
+            
+        Returns:
+            List of table metadata dicts in the same shape as get_table_info,
+            ordered like table_ids (tables that no longer exist are skipped),
+            or by table ID when fetching the whole dataset
+        """
+        ids_key = tuple(table_ids) if table_ids is not None else None
+        return self._cached(
+            ("get_tables_info", dataset_id, ids_key, include_schema),
+            lambda: self._fetch_tables_info(dataset_id, table_ids, include_schema),
+        )
+    
+    def _fetch_tables_info(
+        self,
+        dataset_id: str,
+        table_ids: Optional[List[str]],
+        include_schema: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Get detailed information for many tables via INFORMATION_SCHEMA.
+        
+        Args:
+            dataset_id: BigQuery dataset ID
+            table_ids: BigQuery table IDs, or None for every table in the dataset
+            include_schema: Also fetch column schemas
+            
+        Returns:
+            List of table metadata dicts ordered like table_ids (or by table ID)
+        """
+        dataset_path = f"`{self.project_id}.{dataset_id}"
+        if table_ids is None:
+            tables_filter = columns_filter = ""
+            job_config = QueryJobConfig()
+        else:
+            tables_filter = "WHERE t.table_id IN UNNEST(@table_ids)"
+            columns_filter = "WHERE c.table_name IN UNNEST(@table_ids)"
+            job_config = QueryJobConfig(
+                query_parameters=[ArrayQueryParameter("table_ids", "STRING", table_ids)]
+            )
+        tables_query = f"""
+            SELECT
+                t.table_id,
+                t.creation_time,
+                t.last_modified_time,
+                t.row_count,
+                t.size_bytes,
+                d.option_value AS description,
+                f.option_value AS friendly_name
+            FROM {dataset_path}.__TABLES__` AS t
+            LEFT JOIN {dataset_path}.INFORMATION_SCHEMA.TABLE_OPTIONS` AS d
+                ON d.table_name = t.table_id AND d.option_name = 'description'
+            LEFT JOIN {dataset_path}.INFORMATION_SCHEMA.TABLE_OPTIONS` AS f
+                ON f.table_name = t.table_id AND f.option_name = 'friendly_name'
+            {tables_filter}
+            ORDER BY t.table_id
+        """
+        columns_query = f"""
+            SELECT c.table_name, c.column_name, c.data_type, c.is_nullable, p.description
+            FROM {dataset_path}.INFORMATION_SCHEMA.COLUMNS` AS c
+            LEFT JOIN {dataset_path}.INFORMATION_SCHEMA.COLUMN_FIELD_PATHS` AS p
+                ON p.table_name = c.table_name
+                AND p.column_name = c.column_name
+                AND p.field_path = c.column_name
+            {columns_filter}
+            ORDER BY c.table_name, c.ordinal_position
+        """
+        
+        try:
+            schemas: Dict[str, List[Dict[str, Any]]] = {}
+            if include_schema:
+                column_rows = self.client.query(columns_query, job_config=job_config).result()
+                bqstorage_client = self._get_bqstorage_client()
+                many_tables = table_ids is None or len(table_ids) > BQSTORAGE_MIN_TABLES
+                if many_tables and bqstorage_client is not None:
+                    # Large column listings are streamed as Arrow record batches
+                    # instead of paging through tabledata.list
+                    column_rows = column_rows.to_arrow(
+                        bqstorage_client=bqstorage_client
+                    ).to_pylist()
+                for row in column_rows:
+                    schemas.setdefault(row["table_name"], []).append(
+                        self._schema_field_from_column(row)
+                    )
+            
+            tables: Dict[str, Dict[str, Any]] = {}
+            for row in self.client.query(tables_query, job_config=job_config).result():
+                table_info = {
+                    "id": row.table_id,
+                    "dataset_id": dataset_id,
+                    "project_id": self.project_id,
+                    "description": self._unquote_option(row.description),
+                    "friendly_name": self._unquote_option(row.friendly_name),
+                    "created": self._ms_to_iso(row.creation_time),
+                    "modified": self._ms_to_iso(row.last_modified_time),
+                    "num_rows": row.row_count,
+                    "num_bytes": row.size_bytes,
+                }
+                if include_schema:
+                    table_info["schema"] = schemas.get(row.table_id, [])
+                tables[row.table_id] = table_info
+            
+            self.logger.info(
+                "Retrieved tables info",
+                dataset=dataset_id,
+                count=len(tables)
+            )
+            
+            if table_ids is None:
+                return list(tables.values())
+            return [tables[table_id] for table_id in table_ids if table_id in tables]
+            
+        except GoogleAPIError as e:
+            self.logger.error(
+                "Failed to get tables info",
+                error=str(e),
+                dataset=dataset_id
+            )
+            raise
+    
+    @staticmethod
+    def _schema_field_from_column(row: Any) -> Dict[str, Any]:
+        """Convert an INFORMATION_SCHEMA.COLUMNS row (Row or dict) to a schema field dict."""
+        data_type = row["data_type"]
+        if data_type.startswith("ARRAY<"):
+            mode = "REPEATED"
+            data_type = data_type[len("ARRAY<"):-1]
+        else:
+            mode = "NULLABLE" if row["is_nullable"] == "YES" else "REQUIRED"
+        base_type = data_type.split("<", 1)[0].split("(", 1)[0]
+        return {
+            "name": row["column_name"],
+            "field_type": _LEGACY_FIELD_TYPES.get(base_type, base_type),
+            "mode": mode,
+            "description": row["description"]
+        }
+    
+    @staticmethod
+    def _unquote_option(value: Optional[str]) -> Optional[str]:
+        """Strip the quotes from a TABLE_OPTIONS string literal."""
+        if not value:
+            return None
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value.strip('"')
+    
+    @staticmethod
+    def _ms_to_iso(value: Optional[int]) -> Optional[str]:
+        """Convert a __TABLES__ epoch-millisecond timestamp to ISO format."""
+        if value is None:
+            return None
+        return datetime.fromtimestamp(value / 1000, tz=timezone.utc).isoformat()
+    
+    def invalidate_metadata_cache(self, dataset_id: Optional[str] = None) -> None:
+        """Drop cached dataset, table and schema metadata.
+        
+        Args:
+            dataset_id: Only drop entries for this dataset (and the dataset
+                listing); drop everything when omitted
+        """
+        with self._metadata_lock:
+            if dataset_id is None:
+                self._metadata_cache.clear()
+                return
+            stale = [
+                key for key in self._metadata_cache
+                if len(key) < 2 or key[1] == dataset_id
+            ]
+            for key in stale:
+                del self._metadata_cache[key]
+    
+    def _cached(self, key: Tuple[Any, ...], loader: Callable[[], Any]) -> Any:
+        """Return a cached metadata value, loading it on miss or expiry.
+        
+        Args:
+            key: Cache key (method name followed by its arguments)
+            loader: Callable that fetches the value from BigQuery
+            
+        Returns:
+            Shallow copy of the cached value, so callers may mutate it
+        """
+        now = time.monotonic()
+        entry = self._metadata_cache.get(key)
+        if entry is None or entry[0] <= now:
+            # Load outside the lock so concurrent lookups are not serialized
+            entry = (now + METADATA_CACHE_TTL, loader())
+            with self._metadata_lock:
+                if len(self._metadata_cache) >= METADATA_CACHE_MAXSIZE:
+                    # Evict the oldest entry (dicts preserve insertion order)
+                    self._metadata_cache.pop(next(iter(self._metadata_cache)))
+                self._metadata_cache[key] = entry
+        return copy.copy(entry[1])
+    
+    def _build_query_params(
+        self, params: Dict[str, Any]
+    ) -> List[Union[ScalarQueryParameter, ArrayQueryParameter]]:
+        """Build BigQuery query parameters from a name -> value dict.
+        
+        Args:
+            params: Query parameters dict; list values become array parameters
+            
+        Returns:
+            List of query parameter objects
+        """
+        return [
+            ArrayQueryParameter(name, self._get_array_type(value), value)
+            if isinstance(value, list)
+            else ScalarQueryParameter(name, self._get_scalar_type(value), value)
+            for name, value in params.items()
+        ]
+    
     def _get_scalar_type(self, value: Any) -> str:
         """Get BigQuery parameter type for a scalar value.
         
@@ -299,18 +787,16 @@ class BigQueryClient:
         Returns:
             BigQuery type string
         """
-        if isinstance(value, bool):
-            return "BOOL"
-        elif isinstance(value, int):
-            return "INT64"
-        elif isinstance(value, float):
-            return "FLOAT64"
-        elif isinstance(value, str):
-            return "STRING"
-        elif value is None:
-            return "STRING"
-        else:
-            return "STRING"
+        scalar_type = _SCALAR_TYPES.get(type(value))
+        if scalar_type is None:
+            # Subclasses (e.g. IntEnum) fall back to the first matching base type
+            scalar_type = next(
+                (name for base, name in _SCALAR_TYPES.items() if isinstance(value, base)),
+                "STRING",
+            )
+        if scalar_type == "DATETIME" and value.tzinfo is not None:
+            return "TIMESTAMP"
+        return scalar_type
     
     def _get_array_type(self, values: List[Any]) -> str:
         """Get BigQuery parameter type for an array.
@@ -325,4 +811,34 @@ class BigQueryClient:
             return "STRING"
         
         sample = values[0]
-        return self._get_scalar_type(sample)
\ No newline at end of file
+        return self._get_scalar_type(sample)
+
+
+# (project_id, credentials_path) -> process-wide client
+_SHARED_CLIENTS: Dict[Tuple[str, Optional[str]], BigQueryClient] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def get_shared_client(
+    project_id: Optional[str] = None, credentials_path: Optional[str] = None
+) -> BigQueryClient:
+    """Return the process-wide BigQueryClient for a project and credentials.
+    
+    Sharing one client per worker process reuses its HTTP connection pool,
+    Storage Read client and metadata cache across agents and tools instead of
+    re-authenticating and re-connecting for every instance.
+    
+    Args:
+        project_id: Google Cloud project ID (defaults to env var GOOGLE_CLOUD_PROJECT)
+        credentials_path: Path to service account credentials JSON file
+        
+    Returns:
+        Shared BigQueryClient instance
+    """
+    key = (project_id or os.environ.get("GOOGLE_CLOUD_PROJECT"), credentials_path)
+    with _SHARED_CLIENTS_LOCK:
+        client = _SHARED_CLIENTS.get(key)
+        if client is None:
+            client = BigQueryClient(project_id=key[0], credentials_path=credentials_path)
+            _SHARED_CLIENTS[key] = client
+        return client
@@ -6,21 +6,44 @@ BigQuery数据集探索工具
 基于Thrasio IQ企业级多Agent系统的BigQuery x Looker数据分析Agent需求开发。
 """
 
+import asyncio
+import fnmatch
+import functools
 import os
-from typing import Dict, Any, List, Optional, Tuple, Type
+import re
+import time
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Type
 from datetime import datetime
 import structlog
 from google.cloud.exceptions import NotFound, Forbidden, GoogleCloudError
 from langchain.tools import BaseTool
 from pydantic import BaseModel, Field
-from .client import BigQueryClient
+from .client import BigQueryClient, get_shared_client
+
+# 表列表结果的缓存有效期（秒）
+EXPLORER_CACHE_TTL = 300
+
+# 流式返回时每批获取元数据的表数量
+STREAM_BATCH_SIZE = 50
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_table_pattern(pattern: str) -> "re.Pattern[str]":
+    """
+    将通配符模式编译为正则表达式（不区分大小写），同一模式只编译一次
+    
+    逗号分隔的多个模式（如 "sales_*,orders_*"）合并为一个交替正则，
+    每个表名只需由正则引擎扫描一次。
+    """
+    alternatives = [part.strip().lower() for part in pattern.split(",") if part.strip()]
+    return re.compile("|".join(map(fnmatch.translate, alternatives)))
 
 
 class DatasetExplorerInput(BaseModel):
     """数据集探索工具的输入参数"""
     dataset_id: str = Field(description="要探索的数据集ID")
     include_table_details: bool = Field(default=False, description="是否包含表的详细信息（如列信息、行数等）")
-    table_pattern: Optional[str] = Field(default=None, description="表名过滤模式（支持通配符）")
+    table_pattern: Optional[str] = Field(default=None, description="表名过滤模式（支持通配符，多个模式用逗号分隔）")
     max_tables: int = Field(default=100, description="最大返回表数量")
 
 
@@ -82,6 +105,8 @@ class BigQueryDatasetExplorer(BaseTool):
         super().__init__(**kwargs)
         self.client = client
         self.logger = structlog.get_logger()
+        # (dataset_id, table_pattern, include_details, max_tables) -> (写入时间, 表信息列表)
+        self._cache_tables: Dict[Tuple[str, Optional[str], bool, int], Tuple[float, List[Dict[str, Any]]]] = {}
         self.logger.info("BigQuery数据集探索工具初始化成功")
     
     def _run(
@@ -89,7 +114,8 @@ class BigQueryDatasetExplorer(BaseTool):
         dataset_id: str,
         include_table_details: bool = False,
         table_pattern: Optional[str] = None,
-        max_tables: int = 100
+        max_tables: int = 100,
+        stream: bool = False
     ) -> Dict[str, Any]:
         """
         执行数据集探索
@@ -99,6 +125,8 @@ class BigQueryDatasetExplorer(BaseTool):
             include_table_details: 是否包含表的详细信息
             table_pattern: 表名过滤模式
             max_tables: 最大返回表数量
+            stream: 为True时 "tables" 为按需获取的迭代器，表数量字段为None；
+                迭代过程中的BigQuery错误由调用方处理
             
         Returns:
             包含数据集和表信息的字典
@@ -116,12 +144,22 @@ class BigQueryDatasetExplorer(BaseTool):
             dataset_info = self._get_dataset_info(dataset_id)
             
             # 获取表列表
-            tables = self._list_tables(
-                dataset_id, 
-                include_table_details, 
-                table_pattern, 
-                max_tables
-            )
+            if stream:
+                tables = self._iter_tables(
+                    dataset_id,
+                    include_table_details,
+                    table_pattern,
+                    max_tables
+                )
+                table_count = None
+            else:
+                tables = self._list_tables(
+                    dataset_id, 
+                    include_table_details, 
+                    table_pattern, 
+                    max_tables
+                )
+                table_count = len(tables)
             
             # 构建完整的数据集信息
             result = {
@@ -133,22 +171,22 @@ class BigQueryDatasetExplorer(BaseTool):
                     "created": dataset_info["created"],
                     "modified": dataset_info["modified"],
                     "description": dataset_info["description"],
-                    "table_count": len(tables)
+                    "table_count": table_count
                 },
                 "tables": tables,
                 "metadata": {
-                    "explored_at": datetime.now().isoformat(),
+                    "explored_at_ns": time.time_ns(),
                     "include_details": include_table_details,
                     "table_pattern": table_pattern,
                     "max_tables": max_tables,
-                    "actual_table_count": len(tables)
+                    "actual_table_count": table_count
                 }
             }
             
             self.logger.info(
                 "数据集探索完成", 
                 dataset_id=dataset_id, 
-                table_count=len(tables)
+                table_count=table_count
             )
             
             return result
@@ -214,22 +252,134 @@ class BigQueryDatasetExplorer(BaseTool):
         Returns:
             表信息列表
         """
-        table_ids = self.client.list_tables(dataset_id)
+        cache_key = (dataset_id, table_pattern, include_details, max_tables)
+        cached = self._cache_tables.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < EXPLORER_CACHE_TTL:
+            # 返回副本，调用方修改结果不会污染缓存
+            return [dict(table_info) for table_info in cached[1]]
         
-        result = []
-        for table_id in table_ids[:max_tables]:
-            # 应用表名过滤
-            if table_pattern and not self._match_pattern(table_id, table_pattern):
-                continue
-            
-            table_info = self.client.get_table_info(dataset_id, table_id)
+        tables = self._fetch_tables(dataset_id, include_details, table_pattern, max_tables)
+        self._cache_tables[cache_key] = (time.monotonic(), tables)
+        return [dict(table_info) for table_info in tables]
+    
+    def _fetch_tables(
+        self,
+        dataset_id: str,
+        include_details: bool,
+        table_pattern: Optional[str],
+        max_tables: int
+    ) -> List[Dict[str, Any]]:
+        """从BigQuery获取表列表（不经过缓存），参数同 _list_tables"""
+        selected_ids = self._select_table_ids(dataset_id, table_pattern, max_tables)
+        if not selected_ids:
+            return []
+        
+        # 用INFORMATION_SCHEMA一次性获取所有表的元数据；不需要详细信息时跳过列查询
+        return self.client.get_tables_info(
+            dataset_id, selected_ids, include_schema=include_details
+        )
+    
+    def _iter_tables(
+        self,
+        dataset_id: str,
+        include_details: bool = False,
+        table_pattern: Optional[str] = None,
+        max_tables: int = 100
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        逐个产出表信息，元数据按批次（STREAM_BATCH_SIZE）按需获取
+        
+        调用方提前停止迭代时，后续批次不会再查询；同一时刻只持有一批表结构。
+        参数同 _list_tables。
+        """
+        selected_ids = self._select_table_ids(dataset_id, table_pattern, max_tables)
+        for start in range(0, len(selected_ids), STREAM_BATCH_SIZE):
+            yield from self.client.get_tables_info(
+                dataset_id,
+                selected_ids[start:start + STREAM_BATCH_SIZE],
+                include_schema=include_details
+            )
+    
+    def _select_table_ids(
+        self,
+        dataset_id: str,
+        table_pattern: Optional[str],
+        max_tables: int
+    ) -> List[str]:
+        """
+        按名称筛选出需要获取元数据的表ID
+        
+        Args:
+            dataset_id: 数据集ID
+            table_pattern: 表名过滤模式
+            max_tables: 最大表数量
             
-            if not include_details:
-                table_info.pop("schema", None)
+        Returns:
+            过滤并截断后的表ID列表
+        """
+        prefix = self._literal_prefix(table_pattern) if table_pattern else ""
+        if prefix:
+            # 模式带有字面量前缀时在服务端按前缀筛选；纯"前缀*"模式连LIMIT一起下推
+            pure_prefix = table_pattern[len(prefix):] == "*"
+            table_ids = self.client.list_tables_by_prefix(
+                dataset_id, prefix, limit=max_tables if pure_prefix else None
+            )
+        else:
+            table_ids = self.client.list_tables(dataset_id)
+        
+        # 先按表名过滤（本地、廉价），再截断数量，最后才获取元数据
+        if table_pattern:
+            # 模式只编译一次
+            pattern_regex = _compile_table_pattern(table_pattern)
+            table_ids = [
+                table_id
+                for table_id in table_ids
+                if pattern_regex.match(table_id.lower())
+            ]
+        return table_ids[:max_tables]
+    
+    def invalidate(self, dataset_id: Optional[str] = None) -> None:
+        """
+        使缓存的表列表和元数据失效，在数据集发生写入后调用
+        
+        Args:
+            dataset_id: 只清除该数据集的缓存；为空时清除全部
+        """
+        if dataset_id is None:
+            self._cache_tables.clear()
+        else:
+            for key in [key for key in self._cache_tables if key[0] == dataset_id]:
+                del self._cache_tables[key]
+        self.client.invalidate_metadata_cache(dataset_id)
+    
+    @staticmethod
+    def _literal_prefix(pattern: str) -> str:
+        """
+        提取通配符模式中第一个通配符之前的字面量前缀（小写）
+        
+        Args:
+            pattern: 通配符模式，如 "sales_*"
             
-            result.append(table_info)
+        Returns:
+            字面量前缀，如 "sales_"；模式以通配符开头或包含多个模式时返回空串
+        """
+        if "," in pattern:
+            return ""
+        match = re.match(r"[^*?\[]*", pattern)
+        return match.group(0).lower() if match else ""
+    
+    def _match_pattern(self, table_name: str, pattern: str) -> bool:
+        """
+        检查表名是否匹配通配符模式（不区分大小写）
         
-        return result
+        Args:
+            table_name: 表名
+            pattern: 通配符模式，如 "sales_*"
+            
+        Returns:
+            是否匹配
+        """
+        return _compile_table_pattern(pattern).match(table_name.lower()) is not None
     
     def _get_table_schema(self, dataset_id: str, table_id: str) -> List[Dict[str, Any]]:
         """
@@ -246,26 +396,52 @@ class BigQueryDatasetExplorer(BaseTool):
     
 
     
-    async def _arun(self, *args, **kwargs):
-        """异步运行方法（暂不支持）"""
-        raise NotImplementedError("BigQueryDatasetExplorer不支持异步运行")
+    async def _arun(
+        self,
+        dataset_id: str,
+        include_table_details: bool = False,
+        table_pattern: Optional[str] = None,
+        max_tables: int = 100
+    ) -> Dict[str, Any]:
+        """
+        异步执行数据集探索
+        
+        google-cloud-bigquery 客户端是同步的，因此在工作线程中运行 _run，
+        不阻塞事件循环；与同步路径共享同一份缓存。
+        
+        Args:
+            dataset_id: 数据集ID
+            include_table_details: 是否包含表的详细信息
+            table_pattern: 表名过滤模式
+            max_tables: 最大返回表数量
+            
+        Returns:
+            包含数据集和表信息的字典
+        """
+        return await asyncio.to_thread(
+            self._run,
+            dataset_id,
+            include_table_details,
+            table_pattern,
+            max_tables
+        )
 
 
-def create_dataset_explorer_tool(client: BigQueryClient) -> BigQueryDatasetExplorer:
+def create_dataset_explorer_tool(client: Optional[BigQueryClient] = None) -> BigQueryDatasetExplorer:
     """
     创建数据集探索工具实例
     
     这是一个工厂函数，用于在LangGraph工作流中创建工具实例。
     
     Args:
-        client: BigQueryClient实例
+        client: BigQueryClient实例；为空时使用进程内共享的客户端
         
     Returns:
         配置好的数据集探索工具实例
         
     Example:
         >>> # 在LangGraph工作流中使用
-        >>> from .client import BigQueryClient
+        >>> from .client import BigQueryClient, get_shared_client
         >>> client = BigQueryClient(project_id="my-project")
         >>> explorer = create_dataset_explorer_tool(client)
         >>> result = explorer.run({
@@ -275,7 +451,7 @@ def create_dataset_explorer_tool(client: BigQueryClient) -> BigQueryDatasetExplo
         ...     "max_tables": 50
         ... })
     """
-    return BigQueryDatasetExplorer(client=client)
+    return BigQueryDatasetExplorer(client=client or get_shared_client())
 
 
 # 为了向后兼容，提供一个简化的函数接口
@@ -284,7 +460,8 @@ def explore_dataset(
     client: BigQueryClient,
     include_table_details: bool = False,
     table_pattern: Optional[str] = None,
-    max_tables: int = 100
+    max_tables: int = 100,
+    stream: bool = False
 ) -> Dict[str, Any]:
     """
     探索BigQuery数据集的便捷函数
@@ -295,12 +472,13 @@ def explore_dataset(
         include_table_details: 是否包含表详细信息
         table_pattern: 表名过滤模式
         max_tables: 最大表数量
+        stream: 是否以迭代器形式返回表信息
         
     Returns:
         探索结果字典
         
     Example:
-        >>> from .client import BigQueryClient
+        >>> from .client import BigQueryClient, get_shared_client
         >>> client = BigQueryClient(project_id="my-project")
         >>> result = explore_dataset(
         ...     "dbt_kc_ai_test",
@@ -316,5 +494,6 @@ def explore_dataset(
         dataset_id=dataset_id,
         include_table_details=include_table_details,
         table_pattern=table_pattern,
-        max_tables=max_tables
+        max_tables=max_tables,
+        stream=stream
     )
\ No newline at end of file
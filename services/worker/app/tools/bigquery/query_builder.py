@@ -1,11 +1,82 @@
 """SQL query builder for BigQuery."""
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from datetime import datetime, date
+import functools
 import re
 from enum import Enum
 
 
+# Allow alphanumeric, underscore, dot, and basic SQL functions
+_SAFE_IDENTIFIER = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_\.\(\)\s,]*$')
+
+# NUL-separated list of identifiers (NUL never occurs in a safe identifier)
+_SAFE_IDENTIFIER_LIST = re.compile(
+    r'^[a-zA-Z_][a-zA-Z0-9_\.\(\)\s,]*(?:\0[a-zA-Z_][a-zA-Z0-9_\.\(\)\s,]*)*$'
+)
+
+# Allow project.dataset.table format
+_SAFE_TABLE_NAME = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_\-]*(?:\.[a-zA-Z_][a-zA-Z0-9_\-]*){0,2}$')
+
+# Keywords that must not appear in user-supplied conditions. Matched as whole
+# words so identifiers such as union_id or last_updated are not rejected.
+_DANGEROUS_KEYWORDS = re.compile(
+    r'\b(?:DROP|DELETE|INSERT|UPDATE|CREATE|ALTER|TRUNCATE|EXEC|EXECUTE|UNION|SCRIPT)\b',
+    re.IGNORECASE,
+)
+
+# Value types where_in can bind as a BigQuery ARRAY query parameter
+_ARRAY_PARAM_TYPES = (str, int, float, bool)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_safe_identifier(identifier: str) -> bool:
+    """Check an identifier against _SAFE_IDENTIFIER (memoized per string)."""
+    return _SAFE_IDENTIFIER.match(identifier) is not None
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_safe_table_name(table_name: str) -> bool:
+    """Check a table name against _SAFE_TABLE_NAME (memoized per string)."""
+    return _SAFE_TABLE_NAME.match(table_name) is not None
+
+
+def _quote_string(value: str) -> str:
+    """Quote a string literal, escaping single quotes."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _quote_isoformat(value: Union[datetime, date]) -> str:
+    """Quote a date/datetime literal in ISO format."""
+    return "'" + value.isoformat() + "'"
+
+
+# Exact type -> SQL literal formatter. Keyed on type(value), so bool never
+# falls through to the int formatter.
+_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    str: _quote_string,
+    bool: lambda value: "TRUE" if value else "FALSE",
+    int: str,
+    float: str,
+    datetime: _quote_isoformat,
+    date: _quote_isoformat,
+    type(None): lambda value: "NULL",
+}
+
+
+def _format_sql_value(value: Any) -> str:
+    """Format a Python value as a SQL literal."""
+    formatter = _FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    # Subclasses of supported types (checked in dict order: bool before int,
+    # datetime before date); anything else is quoted as a string
+    for base_type, formatter in _FORMATTERS.items():
+        if isinstance(value, base_type):
+            return formatter(value)
+    return _quote_string(str(value))
+
+
 class AggregationType(Enum):
     """Supported aggregation types."""
     COUNT = "COUNT"
@@ -14,6 +85,11 @@ class AggregationType(Enum):
     MIN = "MIN"
     MAX = "MAX"
     COUNT_DISTINCT = "COUNT(DISTINCT {})"
+    
+    def __init__(self, value: str) -> None:
+        # Bound str.format of the full SQL template, e.g. "SUM({})".format
+        template = value if "{}" in value else f"{value}({{}})"
+        self.format_fn: Callable[[str], str] = template.format
 
 
 class JoinType(Enum):
@@ -27,8 +103,16 @@ class JoinType(Enum):
 class QueryBuilder:
     """SQL query builder for BigQuery with safety features."""
     
-    def __init__(self):
-        """Initialize query builder."""
+    def __init__(self, parameterized: bool = False):
+        """Initialize query builder.
+        
+        Args:
+            parameterized: Emit homogeneous where_in value lists as @query
+                parameters instead of inline literals; retrieve them with
+                build_with_params()
+        """
+        self._parameterized = parameterized
+        self._params: Dict[str, Any] = {}
         self._select_fields: List[str] = []
         self._from_table: Optional[str] = None
         self._joins: List[str] = []
@@ -45,7 +129,17 @@ class QueryBuilder:
         Returns:
             Self for method chaining
         """
-        self.__init__()
+        # Clear in place so the builder's lists are reused across queries
+        self._select_fields.clear()
+        self._from_table = None
+        self._joins.clear()
+        self._where_conditions.clear()
+        self._group_by_fields.clear()
+        self._having_conditions.clear()
+        self._order_by_fields.clear()
+        self._limit_value = None
+        self._with_clauses.clear()
+        self._params.clear()
         return self
     
     def select(self, *fields: str) -> 'QueryBuilder':
@@ -57,10 +151,8 @@ class QueryBuilder:
         Returns:
             Self for method chaining
         """
-        for field in fields:
-            if not self._is_safe_identifier(field):
-                raise ValueError(f"Unsafe field identifier: {field}")
-            self._select_fields.append(field)
+        self._validate_identifiers(fields)
+        self._select_fields.extend(fields)
         return self
     
     def select_all(self) -> 'QueryBuilder':
@@ -86,10 +178,7 @@ class QueryBuilder:
         if not self._is_safe_identifier(field):
             raise ValueError(f"Unsafe field identifier: {field}")
         
-        if agg_type == AggregationType.COUNT_DISTINCT:
-            agg_expr = agg_type.value.format(field)
-        else:
-            agg_expr = f"{agg_type.value}({field})"
+        agg_expr = agg_type.format_fn(field)
         
         if alias:
             if not self._is_safe_identifier(alias):
@@ -153,6 +242,10 @@ class QueryBuilder:
     def where_in(self, field: str, values: List[Any]) -> 'QueryBuilder':
         """Add WHERE field IN (values) condition.
         
+        In parameterized mode a list of str, int, float or bool values becomes
+        ``field IN UNNEST(@pN)``, so the SQL text (and BigQuery's result
+        cache key) does not change with the values.
+        
         Args:
             field: Field name
             values: List of values
@@ -166,21 +259,23 @@ class QueryBuilder:
         if not values:
             raise ValueError("Values list cannot be empty")
         
-        # Format values based on type
-        formatted_values = []
-        for value in values:
-            if isinstance(value, str):
-                formatted_values.append(f"'{value.replace("'", "''")}'")  # Escape single quotes
-            elif isinstance(value, (int, float)):
-                formatted_values.append(str(value))
-            elif isinstance(value, bool):
-                formatted_values.append(str(value).upper())
-            elif value is None:
-                formatted_values.append("NULL")
-            else:
-                formatted_values.append(f"'{str(value).replace("'", "''")}'")  # Escape single quotes
-        
-        condition = f"{field} IN ({', '.join(formatted_values)})"
+        # Format values based on type; homogeneous lists (the common case for
+        # large IN-lists) resolve the formatter once instead of per value
+        value_types = set(map(type, values))
+        value_type = value_types.pop() if len(value_types) == 1 else None
+        if self._parameterized and value_type in _ARRAY_PARAM_TYPES:
+            name = f"p{len(self._params)}"
+            self._params[name] = list(values)
+            self._where_conditions.append(f"{field} IN UNNEST(@{name})")
+            return self
+        if value_type is str:
+            # Escape each string, then let one join supply the quotes
+            formatted = "'" + "', '".join([value.replace("'", "''") for value in values]) + "'"
+        else:
+            formatter = _FORMATTERS.get(value_type, _format_sql_value)
+            formatted = ", ".join(map(formatter, values))
+        
+        condition = f"{field} IN ({formatted})"
         self._where_conditions.append(condition)
         return self
     
@@ -214,10 +309,8 @@ class QueryBuilder:
         Returns:
             Self for method chaining
         """
-        for field in fields:
-            if not self._is_safe_identifier(field):
-                raise ValueError(f"Unsafe field identifier: {field}")
-            self._group_by_fields.append(field)
+        self._validate_identifiers(fields)
+        self._group_by_fields.extend(fields)
         return self
     
     def having(self, condition: str) -> 'QueryBuilder':
@@ -283,8 +376,8 @@ class QueryBuilder:
         if not self._is_safe_identifier(name):
             raise ValueError(f"Unsafe CTE name: {name}")
         
-        # Basic validation for the CTE query
-        if not query.strip():
+        # Basic validation for the CTE query (isspace avoids copying large bodies)
+        if not query or query.isspace():
             raise ValueError("CTE query cannot be empty")
         
         cte = f"{name} AS ({query})"
@@ -306,43 +399,77 @@ class QueryBuilder:
         if not self._from_table:
             raise ValueError("FROM table is required")
         
-        query_parts = []
+        # Write every fragment into one list and join once at the end
+        out: List[str] = []
         
         # WITH clauses
         if self._with_clauses:
-            query_parts.append(f"WITH {', '.join(self._with_clauses)}")
+            out += ("WITH ", ", ".join(self._with_clauses), "\n")
         
-        # SELECT
-        query_parts.append(f"SELECT {', '.join(self._select_fields)}")
-        
-        # FROM
-        query_parts.append(f"FROM {self._from_table}")
+        # SELECT / FROM
+        out += ("SELECT ", ", ".join(self._select_fields), "\nFROM ", self._from_table)
         
         # JOINs
-        if self._joins:
-            query_parts.extend(self._joins)
+        for join_clause in self._joins:
+            out += ("\n", join_clause)
         
         # WHERE
         if self._where_conditions:
-            query_parts.append(f"WHERE {' AND '.join(self._where_conditions)}")
+            out += ("\nWHERE ", " AND ".join(self._where_conditions))
         
         # GROUP BY
         if self._group_by_fields:
-            query_parts.append(f"GROUP BY {', '.join(self._group_by_fields)}")
+            out += ("\nGROUP BY ", ", ".join(self._group_by_fields))
         
         # HAVING
         if self._having_conditions:
-            query_parts.append(f"HAVING {' AND '.join(self._having_conditions)}")
+            out += ("\nHAVING ", " AND ".join(self._having_conditions))
         
         # ORDER BY
         if self._order_by_fields:
-            query_parts.append(f"ORDER BY {', '.join(self._order_by_fields)}")
+            out += ("\nORDER BY ", ", ".join(self._order_by_fields))
         
         # LIMIT
         if self._limit_value is not None:
-            query_parts.append(f"LIMIT {self._limit_value}")
+            out += ("\nLIMIT ", str(self._limit_value))
         
-        return '\n'.join(query_parts)
+        return "".join(out)
+    
+    def build_with_params(self) -> Tuple[str, Dict[str, Any]]:
+        """Build the SQL query together with its query parameters.
+        
+        Returns:
+            (SQL string, parameter name -> value dict) ready for
+            BigQueryClient.execute_query(query, params)
+            
+        Raises:
+            ValueError: If required components are missing
+        """
+        return self.build(), dict(self._params)
+    
+    def _validate_identifiers(self, fields: Tuple[str, ...]) -> None:
+        """Validate several identifiers with one regex scan.
+        
+        Args:
+            fields: Identifiers to check
+            
+        Raises:
+            ValueError: Naming the first unsafe identifier
+        """
+        # The single-scan fast path mirrors the base _is_safe_identifier, so
+        # subclasses that override the check always go through it per field
+        if type(self)._is_safe_identifier is QueryBuilder._is_safe_identifier:
+            joined = "\0".join(fields)
+            # The NUL count guards against a field that itself contains NUL
+            if (
+                joined.count("\0") == len(fields) - 1
+                and _SAFE_IDENTIFIER_LIST.match(joined)
+            ):
+                return
+        # Slow path: check each field and name the offender
+        for field in fields:
+            if not self._is_safe_identifier(field):
+                raise ValueError(f"Unsafe field identifier: {field}")
     
     def _is_safe_identifier(self, identifier: str) -> bool:
         """Check if identifier is safe (no SQL injection).
@@ -353,9 +480,7 @@ class QueryBuilder:
         Returns:
             True if safe, False otherwise
         """
-        # Allow alphanumeric, underscore, dot, and basic SQL functions
-        pattern = r'^[a-zA-Z_][a-zA-Z0-9_\.\(\)\s,]*$'
-        return bool(re.match(pattern, identifier))
+        return _is_safe_identifier(identifier)
     
     def _is_safe_table_name(self, table_name: str) -> bool:
         """Check if table name is safe.
@@ -366,9 +491,7 @@ class QueryBuilder:
         Returns:
             True if safe, False otherwise
         """
-        # Allow project.dataset.table format
-        pattern = r'^[a-zA-Z_][a-zA-Z0-9_\-]*(?:\.[a-zA-Z_][a-zA-Z0-9_\-]*){0,2}$'
-        return bool(re.match(pattern, table_name))
+        return _is_safe_table_name(table_name)
     
     def _is_safe_condition(self, condition: str) -> bool:
         """Check if condition is safe.
@@ -379,18 +502,8 @@ class QueryBuilder:
         Returns:
             True if safe, False otherwise
         """
-        # Basic safety check - no dangerous keywords
-        dangerous_keywords = [
-            'DROP', 'DELETE', 'INSERT', 'UPDATE', 'CREATE', 'ALTER', 
-            'TRUNCATE', 'EXEC', 'EXECUTE', 'UNION', 'SCRIPT'
-        ]
-        
-        condition_upper = condition.upper()
-        for keyword in dangerous_keywords:
-            if keyword in condition_upper:
-                return False
-        
-        return True
+        # Basic safety check - no dangerous keywords (single case-insensitive scan)
+        return _DANGEROUS_KEYWORDS.search(condition) is None
     
     def _format_value(self, value: Any) -> str:
         """Format a value for SQL.
@@ -401,18 +514,7 @@ class QueryBuilder:
         Returns:
             Formatted SQL value
         """
-        if isinstance(value, str):
-            return f"'{value.replace("'", "''")}'"	# Escape single quotes
-        elif isinstance(value, (int, float)):
-            return str(value)
-        elif isinstance(value, bool):
-            return str(value).upper()
-        elif isinstance(value, (datetime, date)):
-            return f"'{value.isoformat()}'"
-        elif value is None:
-            return "NULL"
-        else:
-            return f"'{str(value).replace("'", "''")}'"	  # Escape single quotes
+        return _format_sql_value(value)
 
 
 # Alias for backward compatibility
@@ -4,14 +4,73 @@
 基于Thrasio IQ企业级多Agent系统的BigQuery x Looker数据分析Agent需求开发。
 """
 
+import asyncio
+import json
 import os
-from typing import Dict, Any, List, Optional, Union, Annotated, Type
+import re
+import time
+from datetime import datetime
+from typing import Dict, Any, AsyncIterator, List, Optional, Union, Annotated, Type
 import pandas as pd
 import structlog
 from google.cloud.exceptions import NotFound, Forbidden, GoogleCloudError
 from langchain.tools import BaseTool
 from pydantic import BaseModel, Field, ConfigDict
-from .client import BigQueryClient
+from .client import BigQueryClient, get_shared_client
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
+
+# 模块级logger，实例只做bind，避免每次构造工具都重新生成logger
+logger = structlog.get_logger(__name__)
+
+# 只读查询中不允许出现的写操作/DDL关键字；按整词匹配，updated_at 等列名不会误判
+_DANGEROUS_KEYWORDS = re.compile(
+    r"\b(DROP|DELETE|TRUNCATE|INSERT|UPDATE|CREATE|ALTER|GRANT|REVOKE)\b",
+    re.IGNORECASE,
+)
+
+# 字符串字面量、反引号标识符与注释；检查关键字前先替换为空格，
+# WHERE event_type = 'UPDATE' 这类只读查询不会被误判。
+# 各分支从左到右按位置匹配，字符串里的 -- 或注释里的引号互不干扰
+_SQL_LITERALS_AND_COMMENTS = re.compile(
+    r"'''(?:\\.|[^\\])*?'''"
+    r'|"""(?:\\.|[^\\])*?"""'
+    r"|'(?:\\.|[^'\\\n])*'"
+    r'|"(?:\\.|[^"\\\n])*"'
+    r"|`[^`]*`"
+    r"|--[^\n]*|#[^\n]*|/\*.*?\*/",
+    re.DOTALL,
+)
+
+# 时间分批查询：初始批次为总时间范围的1/16，每批目标行数，及批次长度的调整范围
+BATCH_INITIAL_FRACTION = 16
+BATCH_TARGET_ROWS = 10000
+BATCH_MIN_GROWTH = 0.25
+BATCH_MAX_GROWTH = 4.0
+
+_TIME_COLUMN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class _UnsafeQueryError(ValueError):
+    """查询未通过只读校验"""
+
+
+def _dumps_result(payload: Dict[str, Any]) -> str:
+    """
+    将查询结果序列化为缩进的JSON字符串，优先使用orjson
+
+    orjson原生支持datetime/date/UUID；Decimal等其余类型统一转为字符串。
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            payload,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, indent=2, default=str)
 
 
 class QueryExecutorInput(BaseModel):
@@ -68,17 +127,23 @@ class BigQueryQueryExecutor(BaseTool):
     logger: Any = Field(default=None, exclude=True)
     client: BigQueryClient = Field(default=None, exclude=True)
 
-    def __init__(self, client: BigQueryClient, **kwargs):
+    def __init__(
+        self,
+        client: Optional[BigQueryClient] = None,
+        project_id: Optional[str] = None,
+        **kwargs,
+    ):
         """
         初始化查询执行工具
 
         Args:
-            client: BigQueryClient实例
+            client: BigQueryClient实例；为空时使用进程内共享的客户端
+            project_id: 未传入client时共享客户端使用的项目ID
             **kwargs: 其他参数传递给BaseTool
         """
         super().__init__(**kwargs)
-        self.client = client
-        self.logger = structlog.get_logger()
+        self.client = client or get_shared_client(project_id)
+        self.logger = logger.bind(component=self.__class__.__name__)
         self.logger.info("BigQuery查询执行工具初始化成功")
 
     def _run(
@@ -102,10 +167,8 @@ class BigQueryQueryExecutor(BaseTool):
         Returns:
             JSON格式的查询结果字符串
         """
-        import time
-        import json
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             self.logger.info(
@@ -116,38 +179,49 @@ class BigQueryQueryExecutor(BaseTool):
                 dry_run=dry_run,
             )
 
-            # 执行查询
-            df = self.client.execute_query(
-                query,
-                timeout=timeout,
-                dry_run=dry_run,
-                max_results=max_results
-            )
-
-            execution_time = time.time() - start_time
-
-
-
-            # 构建结果
-            result = QueryResult(
-                success=True,
-                table_name=table_name,
-                row_count=len(df),
-                columns=df.columns.tolist(),
-                data=df.to_dict("records"),
-                bytes_processed=None, # client.execute_query不直接返回bytes_processed
-                execution_time=execution_time,
-                error_message=None,
-            )
+            if not self.validate_query(query):
+                raise _UnsafeQueryError("查询包含写操作或DDL关键字，只允许只读查询")
+
+            columns: List[str] = []
+            data: List[Dict[str, Any]] = []
+            bytes_processed: Optional[int] = None
+            if dry_run:
+                # 试运行只估算扫描量；相同查询的估算结果由客户端缓存
+                bytes_processed = self.client.estimate_query_bytes(query, timeout=timeout)
+            else:
+                # 执行查询；结果只用于JSON序列化，直接迭代行而不构建DataFrame
+                rows = self.client.execute_query(
+                    query,
+                    timeout=timeout,
+                    max_results=max_results,
+                    return_format="iter",
+                )
+                columns = [field.name for field in rows.schema]
+                data = [dict(zip(columns, row.values())) for row in rows]
+
+            execution_time = time.perf_counter() - start_time
+
+            # 构建结果：字段与QueryResult一致，直接组装字典，
+            # 避免pydantic校验并逐行遍历data
+            result = {
+                "success": True,
+                "table_name": table_name,
+                "row_count": len(data),
+                "columns": columns,
+                "data": data,
+                "bytes_processed": bytes_processed, # 仅试运行时提供估算值
+                "execution_time": execution_time,
+                "error_message": None,
+            }
 
             self.logger.info(
                 "查询执行成功",
                 table_name=table_name,
-                row_count=len(df),
+                row_count=len(data),
                 execution_time=execution_time,
             )
 
-            return json.dumps(result.dict(), ensure_ascii=False, indent=2)
+            return _dumps_result(result)
 
         except NotFound as e:
             error_msg = f"表或数据集未找到: {str(e)}"
@@ -167,6 +241,12 @@ class BigQueryQueryExecutor(BaseTool):
                 "查询失败 - BigQuery错误", table_name=table_name, error=error_msg
             )
 
+        except _UnsafeQueryError as e:
+            error_msg = f"查询校验失败: {str(e)}"
+            self.logger.error(
+                "查询失败 - 查询校验失败", table_name=table_name, error=error_msg
+            )
+
         except Exception as e:
             error_msg = f"未知错误: {str(e)}"
             self.logger.error(
@@ -174,7 +254,7 @@ class BigQueryQueryExecutor(BaseTool):
             )
 
         # 返回错误结果
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         error_result = QueryResult(
             success=False,
             table_name=table_name,
@@ -186,7 +266,98 @@ class BigQueryQueryExecutor(BaseTool):
             error_message=error_msg,
         )
 
-        return json.dumps(error_result.dict(), ensure_ascii=False, indent=2)
+        return _dumps_result(error_result.dict())
+
+    def validate_query(self, query: str) -> bool:
+        """
+        检查查询是否为只读查询
+
+        Args:
+            query: SQL查询语句
+
+        Returns:
+            不包含写操作/DDL关键字时返回True
+        """
+        match = _DANGEROUS_KEYWORDS.search(_SQL_LITERALS_AND_COMMENTS.sub(" ", query))
+        if match:
+            self.logger.warning("查询包含危险关键字", keyword=match.group(1).upper())
+            return False
+        return True
+
+    async def arun_batched(
+        self,
+        query: str,
+        time_column: str,
+        start: datetime,
+        end: datetime,
+        max_results: int = 1000,
+        timeout: float = 300.0,
+        target_rows: int = BATCH_TARGET_ROWS,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        按时间范围自适应分批执行查询，逐批产出结果行
+
+        查询被包装为 ``SELECT * FROM (query) WHERE time_column >= @batch_start
+        AND time_column < @batch_end``，批次边界通过查询参数传入，SQL文本保持
+        不变以便命中BigQuery结果缓存。初始批次长度为总范围的1/16，之后按
+        ``target_rows / 上一批行数`` 缩放（限制在0.25到4倍之间），使每批的
+        延迟大致稳定；累计达到 max_results 后停止。
+
+        Args:
+            query: SQL查询语句（只读）
+            time_column: 用于分批的时间列名
+            start: 时间范围起点（包含）
+            end: 时间范围终点（不包含）
+            max_results: 最多产出的总行数
+            timeout: 每批查询的超时时间（秒）
+            target_rows: 每批的目标行数
+
+        Yields:
+            每批的结果行列表
+
+        Raises:
+            ValueError: 查询未通过只读校验或时间列名不合法时
+        """
+        if not self.validate_query(query):
+            raise _UnsafeQueryError("查询包含写操作或DDL关键字，只允许只读查询")
+        if not _TIME_COLUMN.match(time_column):
+            raise ValueError(f"不合法的时间列名: {time_column}")
+
+        batched_query = (
+            f"SELECT * FROM ({query}) "
+            f"WHERE {time_column} >= @batch_start AND {time_column} < @batch_end"
+        )
+        batch_span = (end - start) / BATCH_INITIAL_FRACTION
+        batch_start = start
+        remaining = max_results
+
+        while batch_start < end and remaining > 0:
+            batch_end = min(batch_start + batch_span, end)
+            started_at = time.perf_counter()
+            rows = await asyncio.to_thread(
+                self.client.execute_query,
+                batched_query,
+                {"batch_start": batch_start, "batch_end": batch_end},
+                timeout,
+                max_results=remaining,
+                return_format="dict",
+            )
+            self.logger.info(
+                "分批查询完成",
+                batch_start=batch_start.isoformat(),
+                batch_end=batch_end.isoformat(),
+                row_count=len(rows),
+                execution_time=time.perf_counter() - started_at,
+            )
+
+            if rows:
+                remaining -= len(rows)
+                yield rows
+
+            # 行数少于目标时扩大批次，多于目标时缩小
+            growth = target_rows / len(rows) if rows else BATCH_MAX_GROWTH
+            batch_span *= min(max(growth, BATCH_MIN_GROWTH), BATCH_MAX_GROWTH)
+            batch_start = batch_end
 
     async def _arun(
         self,
@@ -216,12 +387,12 @@ class BigQueryQueryExecutor(BaseTool):
 
 
 # 创建工具实例的便捷函数
-def create_query_executor(client: BigQueryClient) -> BigQueryQueryExecutor:
+def create_query_executor(client: Optional[BigQueryClient] = None) -> BigQueryQueryExecutor:
     """
     创建BigQuery查询执行工具实例
 
     Args:
-        client: BigQueryClient实例
+        client: BigQueryClient实例；为空时使用进程内共享的客户端
 
     Returns:
         BigQueryQueryExecutor实例
@@ -1,27 +1,148 @@
 """Schema management for BigQuery tables and datasets."""
 
+import atexit
 import os
 import json
-from typing import List, Dict, Any, Optional, Set
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Set, Tuple
 import structlog
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from google.cloud.exceptions import NotFound
 from google.api_core.exceptions import GoogleAPIError
 from .client import BigQueryClient
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json encoder
+    orjson = None
 
-@dataclass
+# Module-level logger; instances only bind their component name onto it
+logger = structlog.get_logger(__name__)
+
+# Maximum number of table schemas kept in a SchemaManager's LRU cache
+SCHEMA_CACHE_MAXSIZE = 1024
+
+# Schemas persisted to disk older than this (seconds) are not loaded at startup
+SCHEMA_DISK_CACHE_TTL = 86400
+
+# Delay (seconds) before writing the disk cache, so bursts of updates share one write
+SCHEMA_DISK_SAVE_DELAY = 5.0
+
+# Maximum number of datasets whose schemas are fetched concurrently
+SCHEMA_FETCH_WORKERS = 16
+
+# Field type categories used by TableSchema's typed field lists
+_NUMERIC_TYPES = frozenset({"INTEGER", "INT64", "FLOAT", "FLOAT64", "NUMERIC", "DECIMAL"})
+_STRING_TYPES = frozenset({"STRING", "TEXT"})
+_DATE_TYPES = frozenset({"DATE", "DATETIME", "TIMESTAMP", "TIME"})
+
+# Field type -> category, so bucketing a field takes a single lookup
+_TYPE_CATEGORIES = {
+    **dict.fromkeys(_NUMERIC_TYPES, "numeric"),
+    **dict.fromkeys(_STRING_TYPES, "string"),
+    **dict.fromkeys(_DATE_TYPES, "date"),
+}
+
+
+@dataclass(slots=True)
 class TableSchema:
-    """Represents a BigQuery table schema."""
+    """Represents a BigQuery table schema.
+    
+    Field attributes are stored column-wise, one list per attribute, instead of
+    one dict per field; the ``fields`` property rebuilds the list-of-dicts form.
+    """
     dataset_id: str
     table_id: str
     project_id: str
     description: Optional[str]
-    fields: List[Dict[str, Any]]
     created: Optional[str]
     modified: Optional[str]
     num_rows: Optional[int]
     num_bytes: Optional[int]
+    field_names: List[str]
+    field_types: List[str]
+    field_modes: List[Optional[str]]
+    field_descriptions: List[Optional[str]]
+    # Derived in __post_init__
+    _field_positions: Dict[str, int] = field(init=False, repr=False, compare=False)
+    _numeric_fields: List[str] = field(init=False, repr=False, compare=False)
+    _string_fields: List[str] = field(init=False, repr=False, compare=False)
+    _date_fields: List[str] = field(init=False, repr=False, compare=False)
+    
+    @classmethod
+    def from_fields(cls, fields: List[Dict[str, Any]], **kwargs: Any) -> "TableSchema":
+        """Build a schema from list-of-dict field definitions.
+        
+        Args:
+            fields: Field dicts with "name", "field_type" (or "type"), "mode"
+                and "description" keys, as returned by BigQueryClient
+            **kwargs: The remaining TableSchema attributes
+            
+        Returns:
+            TableSchema object
+        """
+        return cls(
+            field_names=[field["name"] for field in fields],
+            # Only a handful of distinct type names, so share one string each
+            field_types=[
+                sys.intern(field.get("field_type") or field.get("type") or "")
+                for field in fields
+            ],
+            field_modes=[field.get("mode") for field in fields],
+            field_descriptions=[field.get("description") for field in fields],
+            **kwargs
+        )
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TableSchema":
+        """Build a schema from its to_dict() representation.
+        
+        Args:
+            data: Dictionary representation
+            
+        Returns:
+            TableSchema object
+        """
+        attributes = {key: value for key, value in data.items() if key != "fields"}
+        return cls.from_fields(data["fields"], **attributes)
+    
+    def __post_init__(self):
+        """Index fields by name and bucket them by type category once, at construction."""
+        self._field_positions = {
+            name: position for position, name in enumerate(self.field_names)
+        }
+        self._numeric_fields = []
+        self._string_fields = []
+        self._date_fields = []
+        buckets = {
+            "numeric": self._numeric_fields,
+            "string": self._string_fields,
+            "date": self._date_fields,
+        }
+        for name, field_type in zip(self.field_names, self.field_types):
+            category = _TYPE_CATEGORIES.get(field_type)
+            if category is not None:
+                buckets[category].append(name)
+    
+    @property
+    def fields(self) -> List[Dict[str, Any]]:
+        """Field definitions as a list of dicts (built on each access)."""
+        return [self._field_dict(position) for position in range(len(self.field_names))]
+    
+    def _field_dict(self, position: int) -> Dict[str, Any]:
+        """Build the dict form of the field at a position."""
+        return {
+            "name": self.field_names[position],
+            "field_type": self.field_types[position],
+            "mode": self.field_modes[position],
+            "description": self.field_descriptions[position]
+        }
     
     def get_field_names(self) -> List[str]:
         """Get list of field names.
@@ -29,7 +150,7 @@ class TableSchema:
         Returns:
             List of field names
         """
-        return [field["name"] for field in self.fields]
+        return list(self.field_names)
     
     def get_field_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Get field definition by name.
@@ -40,10 +161,10 @@ class TableSchema:
         Returns:
             Field definition or None if not found
         """
-        for field in self.fields:
-            if field["name"] == name:
-                return field
-        return None
+        position = self._field_positions.get(name)
+        if position is None:
+            return None
+        return self._field_dict(position)
     
     def get_numeric_fields(self) -> List[str]:
         """Get list of numeric field names.
@@ -51,11 +172,7 @@ class TableSchema:
         Returns:
             List of numeric field names
         """
-        numeric_types = {"INTEGER", "INT64", "FLOAT", "FLOAT64", "NUMERIC", "DECIMAL"}
-        return [
-            field["name"] for field in self.fields 
-            if field["type"] in numeric_types
-        ]
+        return list(self._numeric_fields)
     
     def get_string_fields(self) -> List[str]:
         """Get list of string field names.
@@ -63,11 +180,7 @@ class TableSchema:
         Returns:
             List of string field names
         """
-        string_types = {"STRING", "TEXT"}
-        return [
-            field["name"] for field in self.fields 
-            if field["type"] in string_types
-        ]
+        return list(self._string_fields)
     
     def get_date_fields(self) -> List[str]:
         """Get list of date/datetime field names.
@@ -75,11 +188,7 @@ class TableSchema:
         Returns:
             List of date/datetime field names
         """
-        date_types = {"DATE", "DATETIME", "TIMESTAMP", "TIME"}
-        return [
-            field["name"] for field in self.fields 
-            if field["type"] in date_types
-        ]
+        return list(self._date_fields)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary.
@@ -103,15 +212,42 @@ class TableSchema:
 class SchemaManager:
     """Manages BigQuery schemas and metadata."""
     
-    def __init__(self, bigquery_client: BigQueryClient):
+    def __init__(
+        self,
+        bigquery_client: BigQueryClient,
+        cache_path: Optional[str] = None,
+        ttl_seconds: int = SCHEMA_DISK_CACHE_TTL,
+    ):
         """Initialize schema manager.
         
         Args:
             bigquery_client: BigQuery client instance
+            cache_path: JSON file that persists cached schemas across restarts
+                (e.g. "~/.cache/schema.json"); schemas are kept in memory only
+                when omitted
+            ttl_seconds: Maximum age of on-disk schemas loaded at startup
         """
         self.client = bigquery_client
-        self.logger = structlog.get_logger()
-        self._schema_cache: Dict[str, TableSchema] = {}
+        self.logger = logger.bind(component=self.__class__.__name__)
+        # "dataset.table" -> schema, in least- to most-recently used order
+        self._schema_cache: "OrderedDict[str, TableSchema]" = OrderedDict()
+        # Lower-cased field name -> {"dataset.table": schema} over the cached schemas
+        self._field_index: Dict[str, Dict[str, TableSchema]] = {}
+        # Datasets whose schemas are all in the cache (and so in the field index)
+        self._loaded_datasets: Set[str] = set()
+        # "dataset.table" -> lower-cased table and field descriptions, built on first search
+        self._description_text: Dict[str, str] = {}
+        # "dataset.table" -> time.time() the schema was fetched or last confirmed unchanged
+        self._cached_at: Dict[str, float] = {}
+        # Keys loaded from disk whose table "modified" time has not been re-checked yet
+        self._unverified: Set[str] = set()
+        
+        self._cache_path = os.path.expanduser(cache_path) if cache_path else None
+        self._ttl_seconds = ttl_seconds
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+        if self._cache_path is not None:
+            self._load_disk_cache()
     
     def get_table_schema(self, dataset_id: str, table_id: str, use_cache: bool = True) -> TableSchema:
         """Get schema for a specific table.
@@ -130,35 +266,26 @@ class SchemaManager:
         cache_key = f"{dataset_id}.{table_id}"
         
         # Check cache first
-        if use_cache and cache_key in self._schema_cache:
-            self.logger.debug("Using cached schema", table=cache_key)
-            return self._schema_cache[cache_key]
+        if use_cache:
+            schema = self._get_cached_schema(cache_key)
+            # A schema loaded from disk is refetched: get_table_info costs the
+            # same single request as checking the table's modified time
+            if schema is not None and cache_key not in self._unverified:
+                self.logger.debug("Using cached schema", table=cache_key)
+                return schema
         
         try:
             # Get table info from BigQuery
             table_info = self.client.get_table_info(dataset_id, table_id)
             
-            # Create TableSchema object
-            schema = TableSchema(
-                dataset_id=dataset_id,
-                table_id=table_id,
-                project_id=table_info["project_id"],
-                description=table_info["description"],
-                fields=table_info["schema"],
-                created=table_info["created"],
-                modified=table_info["modified"],
-                num_rows=table_info["num_rows"],
-                num_bytes=table_info["num_bytes"]
-            )
-            
-            # Cache the schema
-            self._schema_cache[cache_key] = schema
+            # Create and cache the TableSchema object
+            schema = self._cache_schema(dataset_id, table_info)
             
             self.logger.info(
                 "Retrieved table schema",
                 dataset=dataset_id,
                 table=table_id,
-                field_count=len(schema.fields)
+                field_count=len(schema.field_names)
             )
             
             return schema
@@ -181,33 +308,480 @@ class SchemaManager:
         Returns:
             List of TableSchema objects
         """
+        fetch_all = dataset_id not in self._cached_datasets()
         try:
-            # Get list of tables in dataset
-            table_ids = self.client.list_tables(dataset_id)
+            table_ids, fetched = self._fetch_dataset_tables(dataset_id, fetch_all)
+        except GoogleAPIError as e:
+            self.logger.error(
+                "Failed to get dataset schemas",
+                error=str(e),
+                dataset=dataset_id
+            )
+            return []
+        return self._store_dataset_tables(dataset_id, table_ids, fetched)
+    
+    def get_dataset_schemas_bulk(self, dataset_id: str) -> List[TableSchema]:
+        """Fetch schemas for all tables in a dataset, bypassing the cache.
+        
+        Tables and columns come from one INFORMATION_SCHEMA batch query
+        without listing the tables first; the result replaces any cached
+        schemas of the dataset.
+        
+        Args:
+            dataset_id: BigQuery dataset ID
+            
+        Returns:
+            List of TableSchema objects ordered by table ID
             
-            # Get schema for each table
-            schemas = []
-            for table_id in table_ids:
+        Raises:
+            GoogleAPIError: If the batch query fails
+        """
+        fetched = self.client.get_tables_info(dataset_id, None)
+        return self._store_dataset_tables(
+            dataset_id, [table_info["id"] for table_info in fetched], fetched
+        )
+    
+    def _cached_datasets(self) -> Set[str]:
+        """Return the IDs of datasets with at least one cached schema."""
+        return {schema.dataset_id for schema in self._schema_cache.values()}
+    
+    def _load_datasets(self, dataset_ids: List[str]) -> None:
+        """Make sure every given dataset's schemas are cached.
+        
+        Datasets not loaded yet are fetched concurrently; the schema cache
+        itself is only updated from the calling thread.
+        
+        Args:
+            dataset_ids: BigQuery dataset IDs
+        """
+        pending = list(dict.fromkeys(
+            dataset_id for dataset_id in dataset_ids
+            if dataset_id not in self._loaded_datasets
+        ))
+        if len(pending) <= 1:
+            for dataset_id in pending:
+                self.get_dataset_schemas(dataset_id)
+            return
+        
+        cached_datasets = self._cached_datasets()
+        workers = min(SCHEMA_FETCH_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                (dataset_id, pool.submit(
+                    self._fetch_dataset_tables, dataset_id, dataset_id not in cached_datasets
+                ))
+                for dataset_id in pending
+            ]
+            for dataset_id, future in futures:
                 try:
-                    schema = self.get_table_schema(dataset_id, table_id)
-                    schemas.append(schema)
+                    table_ids, fetched = future.result()
                 except GoogleAPIError as e:
-                    self.logger.warning(
-                        "Failed to get schema for table",
+                    self.logger.error(
+                        "Failed to get dataset schemas",
                         error=str(e),
-                        dataset=dataset_id,
-                        table=table_id
+                        dataset=dataset_id
                     )
+                    continue
+                self._store_dataset_tables(dataset_id, table_ids, fetched)
+    
+    def _fetch_dataset_tables(
+        self, dataset_id: str, fetch_all: bool = False
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """List a dataset's tables and fetch the uncached ones in one batch query.
+        
+        Only reads the schema cache, so it is safe to run on worker threads.
+        
+        Args:
+            dataset_id: BigQuery dataset ID
+            fetch_all: Nothing of the dataset is cached; fetch every table in
+                one batch query without listing the tables first
             
-            return schemas
+        Returns:
+            Tuple of (all table IDs, table info dicts for the uncached tables)
+        """
+        if fetch_all:
+            fetched = self.client.get_tables_info(dataset_id, None)
+            return [table_info["id"] for table_info in fetched], fetched
+        
+        table_ids = self.client.list_tables(dataset_id)
+        missing = []
+        unverified = []
+        for table_id in table_ids:
+            cache_key = f"{dataset_id}.{table_id}"
+            if cache_key not in self._schema_cache:
+                missing.append(table_id)
+            elif cache_key in self._unverified:
+                unverified.append(table_id)
+        
+        if unverified:
+            # Schemas loaded from disk are reused only while the table is
+            # unchanged; one metadata query (without columns) checks them all
+            for table_info in self.client.get_tables_info(
+                dataset_id, unverified, include_schema=False
+            ):
+                schema = self._schema_cache.get(f"{dataset_id}.{table_info['id']}")
+                if schema is None or schema.modified != table_info["modified"]:
+                    missing.append(table_info["id"])
+        
+        fetched = self.client.get_tables_info(dataset_id, missing) if missing else []
+        return table_ids, fetched
+    
+    def _store_dataset_tables(
+        self,
+        dataset_id: str,
+        table_ids: List[str],
+        fetched: List[Dict[str, Any]],
+    ) -> List[TableSchema]:
+        """Cache fetched table infos and return the dataset's schemas.
+        
+        Args:
+            dataset_id: BigQuery dataset ID
+            table_ids: All table IDs in the dataset, in listing order
+            fetched: Table info dicts for the tables missing from the cache
             
-        except GoogleAPIError as e:
-            self.logger.error(
-                "Failed to get dataset schemas",
+        Returns:
+            List of TableSchema objects in listing order
+        """
+        fetched_ids = {table_info["id"] for table_info in fetched}
+        schemas: Dict[str, Optional[TableSchema]] = {}
+        now = time.time()
+        # Collect the cached schemas before caching the fetched ones, which
+        # could otherwise evict them from the LRU
+        for table_id in table_ids:
+            if table_id not in fetched_ids:
+                cache_key = f"{dataset_id}.{table_id}"
+                schemas[table_id] = self._get_cached_schema(cache_key)
+                if cache_key in self._unverified and schemas[table_id] is not None:
+                    # Checked unchanged by _fetch_dataset_tables
+                    self._unverified.discard(cache_key)
+                    self._cached_at[cache_key] = now
+                    self._schedule_save()
+        for table_info in fetched:
+            schemas[table_info["id"]] = self._cache_schema(dataset_id, table_info)
+        
+        self._loaded_datasets.add(dataset_id)
+        
+        # Tables dropped since they were listed come back as None
+        ordered = (schemas.get(table_id) for table_id in table_ids)
+        return [schema for schema in ordered if schema is not None]
+    
+    @staticmethod
+    def _dump_json(obj: Any) -> bytes:
+        """Encode an object as indented UTF-8 JSON, using orjson when installed."""
+        if orjson is not None:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    
+    def _get_cached_schema(self, cache_key: str) -> Optional[TableSchema]:
+        """Return a cached schema and mark it as most recently used.
+        
+        Args:
+            cache_key: "dataset.table" key
+            
+        Returns:
+            Cached TableSchema or None
+        """
+        schema = self._schema_cache.get(cache_key)
+        if schema is not None:
+            self._schema_cache.move_to_end(cache_key)
+        return schema
+    
+    def _cache_schema(self, dataset_id: str, table_info: Dict[str, Any]) -> TableSchema:
+        """Build a TableSchema from client table info and cache it.
+        
+        Args:
+            dataset_id: BigQuery dataset ID
+            table_info: Table metadata dict as returned by get_table_info
+            
+        Returns:
+            TableSchema object
+        """
+        schema = TableSchema.from_fields(
+            table_info["schema"],
+            dataset_id=dataset_id,
+            table_id=table_info["id"],
+            project_id=table_info["project_id"],
+            description=table_info["description"],
+            created=table_info["created"],
+            modified=table_info["modified"],
+            num_rows=table_info["num_rows"],
+            num_bytes=table_info["num_bytes"]
+        )
+        self._store_schema(schema, time.time())
+        self._schedule_save()
+        return schema
+    
+    def _store_schema(self, schema: TableSchema, cached_at: float) -> None:
+        """Put a schema into the LRU cache and field-name index.
+        
+        Args:
+            schema: Schema to cache
+            cached_at: time.time() the schema was fetched from BigQuery
+        """
+        cache_key = f"{schema.dataset_id}.{schema.table_id}"
+        previous = self._schema_cache.pop(cache_key, None)
+        if previous is not None:
+            self._unindex_schema(cache_key, previous)
+        self._schema_cache[cache_key] = schema
+        self._cached_at[cache_key] = cached_at
+        for name in schema.field_names:
+            self._field_index.setdefault(name.lower(), {})[cache_key] = schema
+        
+        if len(self._schema_cache) > SCHEMA_CACHE_MAXSIZE:
+            evicted_key, evicted = self._schema_cache.popitem(last=False)
+            self._unindex_schema(evicted_key, evicted)
+            # The dataset is no longer fully cached, so searches must reload it
+            self._loaded_datasets.discard(evicted.dataset_id)
+    
+    def _unindex_schema(self, cache_key: str, schema: TableSchema) -> None:
+        """Remove a schema from the field-name index and per-key bookkeeping.
+        
+        Args:
+            cache_key: "dataset.table" key
+            schema: Schema being dropped from the cache
+        """
+        self._description_text.pop(cache_key, None)
+        self._cached_at.pop(cache_key, None)
+        self._unverified.discard(cache_key)
+        for name in schema.field_names:
+            name = name.lower()
+            tables = self._field_index.get(name)
+            if tables is not None:
+                tables.pop(cache_key, None)
+                if not tables:
+                    del self._field_index[name]
+    
+    def search_tables_by_field(
+        self, field_name: str, dataset_ids: Optional[List[str]] = None
+    ) -> List[TableSchema]:
+        """Find tables that have a field with the given name (case-insensitive).
+        
+        Schemas of datasets not loaded yet are fetched once; after that each
+        search is a single lookup in the field-name index. Datasets that no
+        longer fit in the schema cache are scanned instead, so results are
+        complete even when the searched tables exceed SCHEMA_CACHE_MAXSIZE.
+        
+        Args:
+            field_name: Field name to search for
+            dataset_ids: Datasets to search (defaults to all datasets in the project)
+            
+        Returns:
+            List of matching TableSchema objects
+        """
+        if dataset_ids is None:
+            dataset_ids = self.client.list_datasets()
+        self._load_datasets(dataset_ids)
+        
+        field_key = field_name.lower()
+        wanted = set(dataset_ids)
+        # The index only covers cached schemas; datasets partly evicted while
+        # loading the others must be scanned from a fresh listing
+        unindexed = wanted - self._loaded_datasets
+        matches = [
+            schema
+            for schema in self._field_index.get(field_key, {}).values()
+            if schema.dataset_id in wanted and schema.dataset_id not in unindexed
+        ]
+        if unindexed:
+            self.logger.warning(
+                "Schema cache too small for indexed field search; scanning datasets",
+                field=field_name,
+                dataset_count=len(unindexed),
+                cache_size=SCHEMA_CACHE_MAXSIZE
+            )
+            for dataset_id in dict.fromkeys(dataset_ids):
+                if dataset_id not in unindexed:
+                    continue
+                matches.extend(
+                    schema
+                    for schema in self.get_dataset_schemas(dataset_id)
+                    if any(name.lower() == field_key for name in schema.field_names)
+                )
+        return matches
+    
+    def search_tables_by_description(
+        self, keyword: str, dataset_ids: Optional[List[str]] = None
+    ) -> List[TableSchema]:
+        """Find tables whose description or field descriptions mention a keyword.
+        
+        Args:
+            keyword: Text to search for (case-insensitive)
+            dataset_ids: Datasets to search (defaults to all datasets in the project)
+            
+        Returns:
+            List of matching TableSchema objects, each table at most once
+        """
+        if dataset_ids is None:
+            dataset_ids = self.client.list_datasets()
+        keyword_lower = keyword.lower()
+        
+        self._load_datasets(dataset_ids)
+        
+        seen: Set[Tuple[str, str]] = set()
+        matching_tables = []
+        for dataset_id in dataset_ids:
+            for schema in self.get_dataset_schemas(dataset_id):
+                key = (schema.dataset_id, schema.table_id)
+                if key in seen:
+                    continue
+                seen.add(key)
+                if keyword_lower in self._get_description_text(schema):
+                    matching_tables.append(schema)
+        
+        return matching_tables
+    
+    def _get_description_text(self, schema: TableSchema) -> str:
+        """Return the lower-cased table and field descriptions of a schema.
+        
+        Args:
+            schema: Table schema
+            
+        Returns:
+            Descriptions joined by newlines, computed once per cached schema
+        """
+        cache_key = f"{schema.dataset_id}.{schema.table_id}"
+        text = self._description_text.get(cache_key)
+        if text is None:
+            descriptions = [schema.description or ""]
+            descriptions.extend(description or "" for description in schema.field_descriptions)
+            text = "\n".join(descriptions).lower()
+            self._description_text[cache_key] = text
+        return text
+    
+    def clear_cache(self) -> None:
+        """Drop all cached schemas, the field-name index and description texts."""
+        self._schema_cache.clear()
+        self._field_index.clear()
+        self._loaded_datasets.clear()
+        self._description_text.clear()
+        self._cached_at.clear()
+        self._unverified.clear()
+        self._schedule_save()
+    
+    def _load_disk_cache(self) -> None:
+        """Load this project's unexpired schemas from the cache file.
+        
+        Loaded schemas are re-checked against the table's modified time the
+        first time they are used.
+        """
+        cutoff = time.time() - self._ttl_seconds
+        prefix = f"{self.client.project_id}."
+        loaded = 0
+        try:
+            entries = self._read_disk_entries()
+            # Entries are stored in least- to most-recently used order
+            for key, entry in entries.items():
+                if not key.startswith(prefix) or entry["cached_at"] < cutoff:
+                    continue
+                schema = TableSchema.from_dict(entry["schema"])
+                self._store_schema(schema, entry["cached_at"])
+                self._unverified.add(f"{schema.dataset_id}.{schema.table_id}")
+                loaded += 1
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning(
+                "Ignoring unreadable schema cache file",
                 error=str(e),
-                dataset=dataset_id
+                file_path=self._cache_path
             )
-            return []
+            return
+        
+        self.logger.info(
+            "Loaded schema cache from disk",
+            file_path=self._cache_path,
+            schema_count=loaded
+        )
+    
+    def _read_disk_entries(self) -> Dict[str, Any]:
+        """Read the raw "project.dataset.table" -> entry mapping from the cache file."""
+        with open(self._cache_path, "rb") as f:
+            data = f.read()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    
+    def _schedule_save(self) -> None:
+        """Write the cache file shortly, on a background timer, if persistence is on.
+        
+        A pending write is also flushed at interpreter exit, since the daemon
+        timer thread would otherwise be killed before it fires.
+        """
+        if self._cache_path is None:
+            return
+        with self._save_lock:
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(SCHEMA_DISK_SAVE_DELAY, self.save_cache)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+                atexit.register(self.save_cache)
+    
+    def save_cache(self) -> None:
+        """Write the cached schemas to the cache file now.
+        
+        The cache file may be shared by managers of several projects: entries
+        of other projects already on disk are kept, and this project's entries
+        are replaced by the in-memory cache. The file is written to a unique
+        temporary file and then atomically renamed over the cache file, so
+        readers never see a partial write.
+        """
+        if self._cache_path is None:
+            return
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+                atexit.unregister(self.save_cache)
+            # Copied in single C-level calls, safe against concurrent cache updates
+            items = list(self._schema_cache.items())
+            cached_at = dict(self._cached_at)
+            
+            prefix = f"{self.client.project_id}."
+            try:
+                entries = {
+                    key: entry
+                    for key, entry in self._read_disk_entries().items()
+                    if not key.startswith(prefix)
+                }
+            except FileNotFoundError:
+                entries = {}
+            except (OSError, ValueError, AttributeError) as e:
+                self.logger.warning(
+                    "Replacing unreadable schema cache file",
+                    error=str(e),
+                    file_path=self._cache_path
+                )
+                entries = {}
+            entries.update(
+                (f"{schema.project_id}.{cache_key}", {
+                    "cached_at": cached_at.get(cache_key, 0.0),
+                    "schema": schema.to_dict(),
+                })
+                for cache_key, schema in items
+            )
+            
+            tmp_path = None
+            try:
+                cache_dir = os.path.dirname(self._cache_path) or "."
+                os.makedirs(cache_dir, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=cache_dir,
+                    prefix=f"{os.path.basename(self._cache_path)}.",
+                    suffix=".tmp"
+                )
+                with open(fd, "wb") as f:
+                    f.write(self._dump_json(entries))
+                os.replace(tmp_path, self._cache_path)
+                tmp_path = None
+            except OSError as e:
+                self.logger.error(
+                    "Failed to write schema cache file",
+                    error=str(e),
+                    file_path=self._cache_path
+                )
+            finally:
+                # Never leave a partial temporary file behind
+                if tmp_path is not None:
+                    with suppress(FileNotFoundError):
+                        os.unlink(tmp_path)
     
     def export_schemas_to_json(self, schemas: List[TableSchema], file_path: str):
         """Export a list of schemas to a JSON file.
@@ -217,12 +791,13 @@ class SchemaManager:
             file_path: Path to the output JSON file
         """
         try:
-            # Convert schemas to dictionaries
-            schema_dicts = [schema.to_dict() for schema in schemas]
-            
-            # Write to JSON file
-            with open(file_path, "w") as f:
-                json.dump(schema_dicts, f, indent=2)
+            # Stream one schema at a time instead of building the whole list
+            with open(file_path, "wb", buffering=1024 * 1024) as f:
+                f.write(b"[")
+                for index, schema in enumerate(schemas):
+                    f.write(b"\n" if index == 0 else b",\n")
+                    f.write(self._dump_json(schema.to_dict()))
+                f.write(b"\n]\n")
                 
             self.logger.info(
                 "Exported schemas to JSON",
@@ -1,12 +1,56 @@
 """Looker API client for dashboard and visualization management."""
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+import asyncio
 import os
 import json
+import random
+import time
 import httpx
 import structlog
-from datetime import datetime, timedelta
-from urllib.parse import urljoin
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to httpx's stdlib json decoding
+    orjson = None
+
+try:
+    import h2  # noqa: F401  (needed by httpx for HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:  # Optional: falls back to HTTP/1.1
+    HTTP2_AVAILABLE = False
+
+# Looker workflows issue bursts of small requests (list, then get each item);
+# keep enough warm connections that they do not queue for a TLS handshake
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 50
+HTTP_KEEPALIVE_EXPIRY = 60.0
+
+# Default number of in-flight requests for the *_bulk fetch helpers
+BULK_CONCURRENCY = 20
+
+# GET responses (models, spaces, dashboards, ...) are reused for this many
+# seconds, then revalidated with If-None-Match when the server sent an ETag
+GET_CACHE_TTL = 60.0
+GET_CACHE_MAXSIZE = 256
+
+# Bytes of an error response body kept in log entries and exception messages;
+# Looker error pages can be megabytes and are otherwise decoded in full
+ERROR_BODY_LIMIT = 512
+
+# Chunk size (bytes) for streamed query results
+STREAM_CHUNK_SIZE = 1 << 20
+
+# HTTP methods accepted by _make_request; only POST and PUT send a JSON body
+_REQUEST_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+_BODY_METHODS = frozenset({"POST", "PUT"})
+
+# Throttled (429) requests are retried for every method; server errors only
+# for idempotent methods, since a failed POST may already have been applied
+MAX_RETRIES = 4
+RETRY_MAX_DELAY = 30.0
+_RETRY_SERVER_ERRORS = frozenset({500, 502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
 
 
 class LookerAPIError(Exception):
@@ -14,6 +58,42 @@ class LookerAPIError(Exception):
     pass
 
 
+def _should_retry(method: str, status_code: int) -> bool:
+    """Whether a response with this status is retried for this method."""
+    if status_code == 429:
+        return True
+    return status_code in _RETRY_SERVER_ERRORS and method in _IDEMPOTENT_METHODS
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+    """Seconds to wait before retry number attempt + 1.
+    
+    Honors a Retry-After header given in seconds; otherwise backs off
+    exponentially with up to one second of random jitter.
+    """
+    if retry_after:
+        try:
+            return min(float(retry_after), RETRY_MAX_DELAY)
+        except ValueError:
+            pass  # HTTP-date form; fall back to exponential backoff
+    return min(2 ** attempt, RETRY_MAX_DELAY) + random.uniform(0, 1)
+
+
+def _error_body(content: bytes) -> str:
+    """Decode at most ERROR_BODY_LIMIT bytes of an error response body."""
+    return content[:ERROR_BODY_LIMIT].decode("utf-8", "replace")
+
+
+def _parse_body(content: bytes) -> Any:
+    """Parse a JSON response body; an empty body parses as {}."""
+    if not content:
+        return {}
+    if orjson is not None:
+        # orjson parses the raw bytes directly, without decoding to str first
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 class LookerClient:
     """Client for interacting with Looker API."""
     
@@ -33,19 +113,34 @@ class LookerClient:
             timeout: Request timeout in seconds
         """
         self.base_url = base_url.rstrip('/')
+        self._api_root = f"{self.base_url}/api/4.0"
         self.client_id = client_id
         self.client_secret = client_secret
         self.timeout = timeout
         self.logger = structlog.get_logger()
         
+        # (endpoint, sorted params) -> (expires_at, etag, raw response body).
+        # Bodies are parsed on every hit, so callers never share mutable results
+        self._get_cache: Dict[Tuple[Any, ...], Tuple[float, Optional[str], bytes]] = {}
+        
         # Authentication state
         self._access_token: Optional[str] = None
-        self._token_expires_at: Optional[datetime] = None
-        
-        # HTTP client
+        # time.monotonic() deadline, unaffected by wall-clock adjustments;
+        # 0.0 whenever there is no valid token
+        self._token_expires_at: float = 0.0
+        # Serializes token refreshes so concurrent requests share one login
+        self._auth_lock = asyncio.Lock()
+        
+        # HTTP client; with HTTP/2 concurrent requests share one connection.
+        # No default Content-Type: httpx sets it for requests with a JSON body
         self._http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
             timeout=timeout,
-            headers={"Content-Type": "application/json"}
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+            )
         )
     
     async def __aenter__(self):
@@ -63,8 +158,11 @@ class LookerClient:
         Raises:
             LookerAPIError: If authentication fails
         """
+        # Treat the token as expired until a new one is in place, so a failed
+        # login is retried by the next request
+        self._token_expires_at = 0.0
         try:
-            auth_url = urljoin(self.base_url, "/api/4.0/login")
+            auth_url = f"{self._api_root}/login"
             
             auth_data = {
                 "client_id": self.client_id,
@@ -74,7 +172,9 @@ class LookerClient:
             response = await self._http_client.post(auth_url, json=auth_data)
             
             if response.status_code != 200:
-                raise LookerAPIError(f"Authentication failed: {response.status_code} - {response.text}")
+                raise LookerAPIError(
+                    f"Authentication failed: {response.status_code} - {_error_body(response.content)}"
+                )
             
             auth_result = response.json()
             self._access_token = auth_result.get("access_token")
@@ -84,7 +184,7 @@ class LookerClient:
             
             # Set token expiration (default to 1 hour if not provided)
             expires_in = auth_result.get("expires_in", 3600)
-            self._token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in - 60)  # 1 min buffer
+            self._token_expires_at = time.monotonic() + expires_in - 60  # 1 min buffer
             
             # Update HTTP client headers
             self._http_client.headers["Authorization"] = f"Bearer {self._access_token}"
@@ -98,10 +198,12 @@ class LookerClient:
     
     async def _ensure_authenticated(self) -> None:
         """Ensure we have a valid access token."""
-        if (not self._access_token or 
-            not self._token_expires_at or 
-            datetime.utcnow() >= self._token_expires_at):
-            await self.authenticate()
+        if time.monotonic() < self._token_expires_at:
+            return
+        async with self._auth_lock:
+            # Another request may have refreshed the token while we waited
+            if time.monotonic() >= self._token_expires_at:
+                await self.authenticate()
     
     async def _make_request(
         self, 
@@ -124,38 +226,128 @@ class LookerClient:
         Raises:
             LookerAPIError: If request fails
         """
-        await self._ensure_authenticated()
-        
-        url = urljoin(self.base_url, f"/api/4.0{endpoint}")
+        method = method.upper()
+        if method not in _REQUEST_METHODS:
+            raise LookerAPIError(f"Unsupported HTTP method: {method}")
+        
+        # Inline fast path: only enter _ensure_authenticated when the token expired
+        if time.monotonic() >= self._token_expires_at:
+            await self._ensure_authenticated()
+        
+        url = self._api_root + endpoint
+        
+        # Query runs return fresh data every time and are never cached
+        cache_key = None
+        cached = None
+        headers = None
+        if method == "GET" and "/run/" not in endpoint:
+            cache_key = (endpoint, tuple(sorted((params or {}).items())))
+            cached = self._get_cache.get(cache_key)
+            if cached is not None:
+                expires_at, etag, value = cached
+                if time.monotonic() < expires_at:
+                    return _parse_body(value)
+                if etag:
+                    headers = {"If-None-Match": etag}
         
         try:
-            if method.upper() == "GET":
-                response = await self._http_client.get(url, params=params)
-            elif method.upper() == "POST":
-                response = await self._http_client.post(url, json=data, params=params)
-            elif method.upper() == "PUT":
-                response = await self._http_client.put(url, json=data, params=params)
-            elif method.upper() == "DELETE":
-                response = await self._http_client.delete(url, params=params)
-            else:
-                raise LookerAPIError(f"Unsupported HTTP method: {method}")
+            for attempt in range(MAX_RETRIES + 1):
+                response = await self._http_client.request(
+                    method,
+                    url,
+                    json=data if method in _BODY_METHODS else None,
+                    params=params,
+                    headers=headers
+                )
+                if attempt == MAX_RETRIES or not _should_retry(method, response.status_code):
+                    break
+                delay = _retry_delay(attempt, response.headers.get("Retry-After"))
+                self.logger.warning(
+                    "Retrying Looker API request",
+                    status=response.status_code,
+                    endpoint=endpoint,
+                    attempt=attempt + 1,
+                    delay=round(delay, 2)
+                )
+                await asyncio.sleep(delay)
+            
+            if response.status_code == 304 and cached is not None:
+                # Unchanged since the cached copy; keep it for another TTL
+                self._store_get(cache_key, cached[1], cached[2])
+                return _parse_body(cached[2])
             
             if response.status_code >= 400:
-                error_msg = f"API request failed: {response.status_code} - {response.text}"
-                self.logger.error("Looker API error", status=response.status_code, error=response.text)
+                error_text = _error_body(response.content)
+                error_msg = f"API request failed: {response.status_code} - {error_text}"
+                self.logger.error("Looker API error", status=response.status_code, error=error_text)
                 raise LookerAPIError(error_msg)
             
+            if method != "GET":
+                # Responses embed related resources (e.g. dashboard elements in
+                # dashboards), so any write may change any cached GET
+                self._get_cache.clear()
+            
             # Handle empty responses
-            if response.status_code == 204 or not response.content:
-                return {}
+            content = b"" if response.status_code == 204 else response.content
+            result = _parse_body(content)
             
-            return response.json()
+            if cache_key is not None:
+                self._store_get(cache_key, response.headers.get("ETag"), content)
+            return result
             
         except httpx.RequestError as e:
             raise LookerAPIError(f"Network error: {str(e)}")
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # also raised by orjson.loads
             raise LookerAPIError(f"Invalid JSON response: {str(e)}")
     
+    def _store_get(self, cache_key: Tuple[Any, ...], etag: Optional[str], value: bytes) -> None:
+        """Cache a GET response for GET_CACHE_TTL seconds.
+        
+        Args:
+            cache_key: (endpoint, sorted params) key
+            etag: ETag header of the response, if any
+            value: Raw response body
+        """
+        self._get_cache.pop(cache_key, None)
+        if len(self._get_cache) >= GET_CACHE_MAXSIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            self._get_cache.pop(next(iter(self._get_cache)))
+        self._get_cache[cache_key] = (time.monotonic() + GET_CACHE_TTL, etag, value)
+    
+    def invalidate_cache(self) -> None:
+        """Drop all cached GET responses."""
+        self._get_cache.clear()
+    
+    async def _gather_bounded(
+        self,
+        fetch: Callable[[str], Awaitable[Any]],
+        ids: List[str],
+        concurrency: int
+    ) -> List[Any]:
+        """Run fetch(id) for every ID concurrently, at most `concurrency` at a time.
+        
+        Args:
+            fetch: Coroutine function fetching one object by ID
+            ids: Object IDs
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Results ordered like ids; a failed fetch yields its exception
+            instead of failing the whole batch
+        """
+        # Authenticate once up front rather than in every concurrent request
+        await self._ensure_authenticated()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch_one(object_id: str) -> Any:
+            async with semaphore:
+                return await fetch(object_id)
+        
+        return await asyncio.gather(
+            *(fetch_one(object_id) for object_id in ids),
+            return_exceptions=True
+        )
+    
     async def get_user_info(self) -> Dict[str, Any]:
         """Get current user information.
         
@@ -196,6 +388,21 @@ class LookerClient:
         self.logger.info("Retrieved dashboard", dashboard_id=dashboard_id)
         return dashboard
     
+    async def get_dashboards_bulk(
+        self, dashboard_ids: List[str], concurrency: int = BULK_CONCURRENCY
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Get many dashboards concurrently.
+        
+        Args:
+            dashboard_ids: Dashboard IDs
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Dashboard objects ordered like dashboard_ids; failed fetches are
+            returned as their exception
+        """
+        return await self._gather_bounded(self.get_dashboard, dashboard_ids, concurrency)
+    
     async def create_dashboard(
         self, 
         title: str, 
@@ -294,6 +501,21 @@ class LookerClient:
         self.logger.info("Retrieved look", look_id=look_id)
         return look
     
+    async def get_looks_bulk(
+        self, look_ids: List[str], concurrency: int = BULK_CONCURRENCY
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Get many Looks concurrently.
+        
+        Args:
+            look_ids: Look IDs
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Look objects ordered like look_ids; failed fetches are returned as
+            their exception
+        """
+        return await self._gather_bounded(self.get_look, look_ids, concurrency)
+    
     async def create_look(
         self, 
         title: str,
@@ -363,6 +585,66 @@ class LookerClient:
         )
         return results
     
+    async def run_query_stream(
+        self,
+        query_id: str,
+        result_format: str = "csv",
+        limit: Optional[int] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Run a query and stream the raw results as they arrive.
+        
+        Unlike run_query, the response body is never buffered or parsed as a
+        whole, so memory use stays at about one chunk for large exports.
+        
+        Args:
+            query_id: Query ID to run
+            result_format: Result format (csv, json, ...)
+            limit: Optional row limit
+            chunk_size: Size of the yielded chunks in bytes
+            
+        Yields:
+            Consecutive chunks of the response body
+            
+        Raises:
+            LookerAPIError: If the request fails
+        """
+        await self._ensure_authenticated()
+        
+        url = f"{self._api_root}/queries/{query_id}/run/{result_format}"
+        params: Dict[str, Any] = {"result_format": result_format}
+        if limit:
+            params["limit"] = limit
+        
+        try:
+            async with self._http_client.stream("GET", url, params=params) as response:
+                if response.status_code >= 400:
+                    # Read only as much of the error body as is reported
+                    content = b""
+                    async for chunk in response.aiter_bytes():
+                        content += chunk
+                        if len(content) >= ERROR_BODY_LIMIT:
+                            break
+                    error_text = _error_body(content)
+                    self.logger.error("Looker API error", status=response.status_code, error=error_text)
+                    raise LookerAPIError(
+                        f"API request failed: {response.status_code} - {error_text}"
+                    )
+                
+                size = 0
+                async for chunk in response.aiter_bytes(chunk_size):
+                    size += len(chunk)
+                    yield chunk
+        except httpx.RequestError as e:
+            raise LookerAPIError(f"Network error: {str(e)}")
+        
+        self.logger.info(
+            "Streamed query results",
+            query_id=query_id,
+            format=result_format,
+            bytes=size
+        )
+    
     async def list_spaces(self) -> List[Dict[str, Any]]:
         """List all spaces.
         
@@ -388,6 +670,21 @@ class LookerClient:
         self.logger.info("Retrieved space", space_id=space_id)
         return space
     
+    async def get_spaces_bulk(
+        self, space_ids: List[str], concurrency: int = BULK_CONCURRENCY
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Get many spaces concurrently.
+        
+        Args:
+            space_ids: Space IDs
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Space objects ordered like space_ids; failed fetches are returned
+            as their exception
+        """
+        return await self._gather_bounded(self.get_space, space_ids, concurrency)
+    
     async def list_models(self) -> List[Dict[str, Any]]:
         """List all LookML models.
         
@@ -415,4 +712,19 @@ class LookerClient:
             model=model_name, 
             count=len(explores)
         )
-        return explores
\ No newline at end of file
+        return explores
+    
+    async def get_models_explores_bulk(
+        self, model_names: List[str], concurrency: int = BULK_CONCURRENCY
+    ) -> List[Union[List[Dict[str, Any]], Exception]]:
+        """Get the explores of many models concurrently.
+        
+        Args:
+            model_names: Model names
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Explore lists ordered like model_names; failed fetches are returned
+            as their exception
+        """
+        return await self._gather_bounded(self.get_model_explores, model_names, concurrency)
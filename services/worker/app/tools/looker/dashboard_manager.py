@@ -1,14 +1,23 @@
 """Dashboard management for Looker."""
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+import asyncio
+import copy
+import time
 import structlog
 from dataclasses import dataclass
 from datetime import datetime
 
 from .client import LookerClient, LookerAPIError
 
+# Default number of concurrent Looker requests when a manager call fans out
+DEFAULT_CONCURRENCY_LIMIT = 10
 
-@dataclass
+# Seconds that parsed dashboards and dashboard listings are reused
+DASHBOARD_CACHE_TTL = 30.0
+
+
+@dataclass(slots=True)
 class DashboardElement:
     """Represents a dashboard element (tile)."""
     id: str
@@ -75,7 +84,7 @@ class DashboardElement:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class Dashboard:
     """Represents a Looker dashboard."""
     id: str
@@ -133,14 +142,100 @@ class Dashboard:
 class DashboardManager:
     """Manages Looker dashboards and their elements."""
     
-    def __init__(self, looker_client: LookerClient):
+    def __init__(
+        self,
+        looker_client: LookerClient,
+        concurrency_limit: int = DEFAULT_CONCURRENCY_LIMIT
+    ):
         """Initialize dashboard manager.
         
         Args:
             looker_client: Looker client instance
+            concurrency_limit: Maximum number of concurrent requests when
+                fanning out (e.g. adding many elements to a dashboard)
         """
         self.client = looker_client
+        self.concurrency_limit = concurrency_limit
         self.logger = structlog.get_logger()
+        
+        # ("dashboard", id) / ("list", space_id) -> (expires_at, value)
+        self._cache: Dict[Tuple[str, Optional[str]], Tuple[float, Any]] = {}
+        # Key -> (lock, number of callers using it) while a miss is in flight, so
+        # concurrent misses share a single fetch; dropped when the last caller leaves
+        self._fetch_locks: Dict[Tuple[str, Optional[str]], List[Any]] = {}
+        # Bumped on every invalidation; fetches started before it are not cached
+        self._cache_generation = 0
+    
+    async def _cached(
+        self,
+        key: Tuple[str, Optional[str]],
+        loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return a cached value, loading it on miss or expiry.
+        
+        Args:
+            key: Cache key
+            loader: Coroutine function fetching the value from Looker
+            
+        Returns:
+            Cached or freshly loaded value
+        """
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        
+        waiting = self._fetch_locks.get(key)
+        if waiting is None:
+            waiting = self._fetch_locks[key] = [asyncio.Lock(), 0]
+        waiting[1] += 1
+        try:
+            async with waiting[0]:
+                # Another caller may have loaded it while we waited
+                entry = self._cache.get(key)
+                if entry is not None and time.monotonic() < entry[0]:
+                    return entry[1]
+                
+                generation = self._cache_generation
+                value = await loader()
+                if generation == self._cache_generation:
+                    self._cache[key] = (time.monotonic() + DASHBOARD_CACHE_TTL, value)
+                return value
+        finally:
+            waiting[1] -= 1
+            if not waiting[1]:
+                del self._fetch_locks[key]
+    
+    def _invalidate(self, dashboard_id: Optional[str] = None) -> None:
+        """Drop cached listings and one dashboard, or every dashboard when omitted."""
+        self._cache_generation += 1
+        if dashboard_id is None:
+            self._cache.clear()
+            return
+        self._cache.pop(("dashboard", dashboard_id), None)
+        for key in [key for key in self._cache if key[0] == "list"]:
+            del self._cache[key]
+    
+    @staticmethod
+    def _copy_dashboard(dashboard: Dashboard) -> Dashboard:
+        """Deep-copy a cached dashboard so callers can modify it and its elements."""
+        return copy.deepcopy(dashboard)
+    
+    async def _gather_bounded(self, coros: Iterable[Awaitable[Any]]) -> List[Any]:
+        """Await coroutines concurrently, at most concurrency_limit at a time.
+        
+        Args:
+            coros: Coroutines to run
+            
+        Returns:
+            Results in the order of coros
+        """
+        semaphore = asyncio.Semaphore(self.concurrency_limit)
+        
+        async def run(coro: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await coro
+        
+        return await asyncio.gather(*(run(coro) for coro in coros))
     
     async def create_dashboard(
         self, 
@@ -172,14 +267,17 @@ class DashboardManager:
             )
             
             dashboard = Dashboard.from_api_response(dashboard_data)
+            self._invalidate(dashboard.id)
             
-            # Add elements if provided
+            # Add elements if provided; the POSTs are independent, so issue
+            # them concurrently (bounded to stay under Looker's rate limits).
+            # The created elements are returned in order, so no refresh of the
+            # dashboard is needed
             if elements:
-                for element in elements:
-                    await self.add_element_to_dashboard(dashboard.id, element)
-                
-                # Refresh dashboard to get updated elements
-                dashboard = await self.get_dashboard(dashboard.id)
+                dashboard.elements = await self._gather_bounded(
+                    self.add_element_to_dashboard(dashboard.id, element)
+                    for element in elements
+                )
             
             self.logger.info(
                 "Created dashboard",
@@ -211,16 +309,11 @@ class DashboardManager:
             LookerAPIError: If dashboard retrieval fails
         """
         try:
-            dashboard_data = await self.client.get_dashboard(dashboard_id)
-            dashboard = Dashboard.from_api_response(dashboard_data)
-            
-            self.logger.info(
-                "Retrieved dashboard",
-                dashboard_id=dashboard_id,
-                element_count=len(dashboard.elements)
+            dashboard = await self._cached(
+                ("dashboard", dashboard_id),
+                lambda: self._fetch_dashboard(dashboard_id)
             )
-            
-            return dashboard
+            return self._copy_dashboard(dashboard)
             
         except LookerAPIError as e:
             self.logger.error(
@@ -230,6 +323,19 @@ class DashboardManager:
             )
             raise
     
+    async def _fetch_dashboard(self, dashboard_id: str) -> Dashboard:
+        """Fetch and parse a dashboard from Looker."""
+        dashboard_data = await self.client.get_dashboard(dashboard_id)
+        dashboard = Dashboard.from_api_response(dashboard_data)
+        
+        self.logger.info(
+            "Retrieved dashboard",
+            dashboard_id=dashboard_id,
+            element_count=len(dashboard.elements)
+        )
+        
+        return dashboard
+    
     async def list_dashboards(self, space_id: Optional[str] = None) -> List[Dashboard]:
         """List dashboards, optionally filtered by space.
         
@@ -240,19 +346,11 @@ class DashboardManager:
             List of Dashboard objects
         """
         try:
-            dashboards_data = await self.client.list_dashboards(space_id=space_id)
-            dashboards = [
-                Dashboard.from_api_response(data) 
-                for data in dashboards_data
-            ]
-            
-            self.logger.info(
-                "Listed dashboards",
-                count=len(dashboards),
-                space_id=space_id
+            dashboards = await self._cached(
+                ("list", space_id),
+                lambda: self._fetch_dashboards(space_id)
             )
-            
-            return dashboards
+            return [self._copy_dashboard(dashboard) for dashboard in dashboards]
             
         except LookerAPIError as e:
             self.logger.error(
@@ -262,6 +360,22 @@ class DashboardManager:
             )
             raise
     
+    async def _fetch_dashboards(self, space_id: Optional[str]) -> List[Dashboard]:
+        """Fetch and parse a dashboard listing from Looker."""
+        dashboards_data = await self.client.list_dashboards(space_id=space_id)
+        dashboards = [
+            Dashboard.from_api_response(data) 
+            for data in dashboards_data
+        ]
+        
+        self.logger.info(
+            "Listed dashboards",
+            count=len(dashboards),
+            space_id=space_id
+        )
+        
+        return dashboards
+    
     async def update_dashboard(
         self, 
         dashboard_id: str, 
@@ -290,6 +404,7 @@ class DashboardManager:
                 return await self.get_dashboard(dashboard_id)
             
             dashboard_data = await self.client.update_dashboard(dashboard_id, updates)
+            self._invalidate(dashboard_id)
             dashboard = Dashboard.from_api_response(dashboard_data)
             
             self.logger.info(
@@ -316,6 +431,7 @@ class DashboardManager:
         """
         try:
             await self.client.delete_dashboard(dashboard_id)
+            self._invalidate(dashboard_id)
             
             self.logger.info("Deleted dashboard", dashboard_id=dashboard_id)
             
@@ -350,6 +466,7 @@ class DashboardManager:
                     **element.to_api_dict()
                 }
             )
+            self._invalidate(dashboard_id)
             
             created_element = DashboardElement.from_api_response(element_data)
             
@@ -390,6 +507,8 @@ class DashboardManager:
                 f"/dashboard_elements/{element_id}",
                 data=updates
             )
+            # Element responses don't say which dashboard they belong to
+            self._invalidate()
             
             updated_element = DashboardElement.from_api_response(element_data)
             
@@ -420,6 +539,7 @@ class DashboardManager:
                 "DELETE",
                 f"/dashboard_elements/{element_id}"
             )
+            self._invalidate()
             
             self.logger.info("Deleted dashboard element", element_id=element_id)
             
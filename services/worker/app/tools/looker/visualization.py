@@ -2,11 +2,35 @@
 
 from typing import Any, Dict, List, Optional, Union
 from enum import Enum
+import re
 import structlog
 from dataclasses import dataclass, field
 
 from .client import LookerClient, LookerAPIError
 
+# Dimension names suggesting a time series
+_TIME_DIMENSION = re.compile(r"date|time|month|year|day", re.IGNORECASE)
+
+# Predefined color palettes returned by get_color_palette
+_COLOR_PALETTES = {
+    "default": (
+        "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
+        "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"
+    ),
+    "blue": (
+        "#08519c", "#3182bd", "#6baed6", "#9ecae1", "#c6dbef"
+    ),
+    "green": (
+        "#00441b", "#238b45", "#66c2a4", "#abdda4", "#e5f5f9"
+    ),
+    "red": (
+        "#67000d", "#a50f15", "#cb181d", "#ef3b2c", "#fb6a4a"
+    ),
+    "purple": (
+        "#3f007d", "#54278f", "#756bb1", "#9e9ac8", "#cbc9e2"
+    ),
+}
+
 
 class ChartType(Enum):
     """Supported chart types in Looker."""
@@ -445,8 +469,7 @@ class VisualizationManager:
         # Line chart for time series
         if num_dimensions == 1:
             # Check if dimension looks like a date
-            dim_name = dimensions[0].lower()
-            if any(word in dim_name for word in ['date', 'time', 'month', 'year', 'day']):
+            if _TIME_DIMENSION.search(dimensions[0]):
                 return ChartType.LINE
         
         # Bar chart as default for categorical data
@@ -465,23 +488,4 @@ class VisualizationManager:
         Returns:
             List of color hex codes
         """
-        palettes = {
-            "default": [
-                "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
-                "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"
-            ],
-            "blue": [
-                "#08519c", "#3182bd", "#6baed6", "#9ecae1", "#c6dbef"
-            ],
-            "green": [
-                "#00441b", "#238b45", "#66c2a4", "#abdda4", "#e5f5f9"
-            ],
-            "red": [
-                "#67000d", "#a50f15", "#cb181d", "#ef3b2c", "#fb6a4a"
-            ],
-            "purple": [
-                "#3f007d", "#54278f", "#756bb1", "#9e9ac8", "#cbc9e2"
-            ]
-        }
-        
-        return palettes.get(palette_name, palettes["default"])
\ No newline at end of file
+        return list(_COLOR_PALETTES.get(palette_name, _COLOR_PALETTES["default"]))
\ No newline at end of file
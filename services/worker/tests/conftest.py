@@ -0,0 +1,23 @@
+"""Shared pytest setup for the worker service tests."""
+
+import os
+import sys
+from pathlib import Path
+
+# Make the ``app`` package importable regardless of the working directory
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Importing ``app`` builds Settings, whose config sections are required;
+# values already set in the environment take precedence
+for name, value in {
+    "GOOGLE_CLOUD__PROJECT_ID": "test-project",
+    "GOOGLE_CLOUD__BIGQUERY_PROJECT_ID": "test-project",
+    "LLM__PROJECT_ID": "test-project",
+    "WORKER__QUEUE_NAME": "data_analysis",
+    "LANGSMITH__TRACING": "false",
+}.items():
+    os.environ.setdefault(name, value)
+
+# Manual GCP configuration check, run as ``python tests/test_config.py``; it
+# executes at import time and exits the process when ADC is unavailable
+collect_ignore = ["test_config.py"]
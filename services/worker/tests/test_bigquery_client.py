@@ -0,0 +1,79 @@
+"""Tests for BigQueryClient result downloads."""
+
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+import structlog
+
+from app.tools.bigquery import client as bigquery_client
+from app.tools.bigquery.client import BigQueryClient
+
+STORAGE_CLIENT = object()
+
+
+class FakeRowIterator:
+    """Records the keyword arguments of each download call."""
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def to_dataframe(self, **kwargs):
+        self.calls.append(("to_dataframe", kwargs))
+        return pd.DataFrame({"id": [1]})
+
+    def to_arrow(self, **kwargs):
+        self.calls.append(("to_arrow", kwargs))
+        return SimpleNamespace(num_rows=1)
+
+
+class FakeQueryJob:
+    total_bytes_processed = 0
+    billing_tier = None
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def result(self, **kwargs):
+        self.calls.append(("result", kwargs))
+        return FakeRowIterator(self.calls)
+
+
+class FakeBigQuery:
+    def __init__(self):
+        self.calls = []
+
+    def query(self, query, job_config=None, timeout=None):
+        return FakeQueryJob(self.calls)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # The Storage client is injected, so the optional package is not needed
+    monkeypatch.setattr(bigquery_client, "bigquery_storage", object())
+    instance = BigQueryClient.__new__(BigQueryClient)
+    instance.logger = structlog.get_logger()
+    instance.client = FakeBigQuery()
+    instance._bqstorage_client = STORAGE_CLIENT
+    return instance
+
+
+@pytest.mark.parametrize("return_format", ["dataframe", "arrow"])
+def test_capped_results_are_downloaded_without_storage_client(client, return_format):
+    client.execute_query("SELECT 1", max_results=10, return_format=return_format)
+
+    (_, result_kwargs), (_, download_kwargs) = client.client.calls
+    assert result_kwargs["max_results"] == result_kwargs["page_size"] == 10
+    assert download_kwargs == {
+        "bqstorage_client": None,
+        "create_bqstorage_client": False,
+    }
+
+
+@pytest.mark.parametrize("return_format", ["dataframe", "arrow"])
+def test_uncapped_results_use_shared_storage_client(client, return_format):
+    client.execute_query("SELECT 1", return_format=return_format)
+
+    (_, result_kwargs), (_, download_kwargs) = client.client.calls
+    assert result_kwargs["max_results"] is None
+    assert download_kwargs["bqstorage_client"] is STORAGE_CLIENT
@@ -0,0 +1,92 @@
+"""Tests for the DashboardManager dashboard cache."""
+
+import asyncio
+
+from app.tools.looker.dashboard_manager import DashboardManager
+
+
+class FakeLookerClient:
+    """Counts dashboard reads; each read is slow enough for misses to overlap."""
+
+    def __init__(self):
+        self.reads = 0
+        self.title = "Sales"
+
+    def _dashboard(self, dashboard_id):
+        return {
+            "id": dashboard_id,
+            "title": self.title,
+            "space_id": "s1",
+            "dashboard_elements": [{"id": "e1", "type": "vis", "title": "Revenue"}],
+        }
+
+    async def get_dashboard(self, dashboard_id):
+        self.reads += 1
+        await asyncio.sleep(0.01)
+        return self._dashboard(dashboard_id)
+
+    async def list_dashboards(self, space_id=None):
+        self.reads += 1
+        return [self._dashboard("1")]
+
+    async def update_dashboard(self, dashboard_id, updates):
+        self.title = updates["title"]
+        return self._dashboard(dashboard_id)
+
+    async def delete_dashboard(self, dashboard_id):
+        return None
+
+    async def _make_request(self, method, endpoint, data=None):
+        return {"id": "e1", "type": "vis", "title": "Changed"}
+
+
+def test_repeated_and_concurrent_reads_share_one_fetch():
+    client = FakeLookerClient()
+    manager = DashboardManager(client)
+
+    async def run():
+        await asyncio.gather(*(manager.get_dashboard("1") for _ in range(5)))
+        await manager.get_dashboard("1")
+
+    asyncio.run(run())
+    assert client.reads == 1
+    assert manager._fetch_locks == {}
+
+
+def test_returned_dashboards_do_not_share_state_with_the_cache():
+    manager = DashboardManager(FakeLookerClient())
+
+    async def run():
+        dashboard = await manager.get_dashboard("1")
+        dashboard.title = "mutated"
+        dashboard.elements[0].title = "mutated"
+        dashboard.elements.clear()
+        listed = await manager.list_dashboards()
+        listed[0].elements[0].title = "mutated"
+        return await manager.get_dashboard("1"), await manager.list_dashboards()
+
+    dashboard, listed = asyncio.run(run())
+    assert dashboard.title == "Sales"
+    assert [element.title for element in dashboard.elements] == ["Revenue"]
+    assert listed[0].elements[0].title == "Revenue"
+
+
+def test_writes_invalidate_cached_dashboards_and_listings():
+    client = FakeLookerClient()
+    manager = DashboardManager(client)
+
+    async def run():
+        await manager.get_dashboard("1")
+        await manager.list_dashboards()
+        await manager.update_dashboard("1", title="Renamed")
+        dashboard = await manager.get_dashboard("1")
+        listed = await manager.list_dashboards()
+        await manager.update_dashboard_element("e1", {"title": "Changed"})
+        await manager.get_dashboard("1")
+        await manager.delete_dashboard("1")
+        await manager.list_dashboards()
+        return dashboard, listed
+
+    dashboard, listed = asyncio.run(run())
+    assert dashboard.title == listed[0].title == "Renamed"
+    assert client.reads == 6
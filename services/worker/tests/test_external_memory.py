@@ -0,0 +1,170 @@
+"""Tests for the external memory store."""
+
+import json
+import os
+import threading
+import time
+
+import msgpack
+import pytest
+
+from app.memory import external_memory
+from app.memory.external_memory import ExternalMemory, _write_atomic
+
+
+def test_session_index_lists_stored_memories(tmp_path):
+    memory = ExternalMemory(str(tmp_path))
+    first = memory.store_analysis_result("s1", {"value": 1})
+    second = memory.store_analysis_result("s1", {"value": 2})
+    other = memory.store_analysis_result("s2", {"value": 3})
+
+    assert sorted(memory.list_session_memories("s1")) == sorted([first, second])
+    assert memory.list_session_memories("s2") == [other]
+    assert memory.list_session_memories("missing") == []
+
+
+def test_session_index_persists_across_instances(tmp_path):
+    key = ExternalMemory(str(tmp_path)).store_analysis_result("s1", {"value": 1})
+
+    assert ExternalMemory(str(tmp_path)).list_session_memories("s1") == [key]
+
+
+def test_session_index_is_rebuilt_from_existing_files(tmp_path):
+    memory = ExternalMemory(str(tmp_path))
+    key = memory.store_analysis_result("s1", {"value": 1})
+    os.remove(memory.index_path)
+
+    assert ExternalMemory(str(tmp_path)).list_session_memories("s1") == [key]
+
+
+def test_cleanup_removes_expired_files_and_index_rows(tmp_path):
+    memory = ExternalMemory(str(tmp_path))
+    old_key = memory.store_analysis_result("s1", {"value": 1})
+    new_key = memory.store_analysis_result("s1", {"value": 2})
+    with memory._index() as conn:
+        conn.execute(
+            "UPDATE mem SET timestamp = ? WHERE memory_key = ?",
+            (time.time() - 30 * 24 * 60 * 60, old_key),
+        )
+
+    assert memory.cleanup_old_memories(days_old=7) == 1
+    assert memory.list_session_memories("s1") == [new_key]
+    assert memory.retrieve_analysis_result(old_key) is None
+    assert memory.retrieve_analysis_result(new_key) == {"value": 2}
+
+
+def test_memory_round_trips_through_msgpack(tmp_path):
+    memory = ExternalMemory(str(tmp_path))
+    data = {"text": "数据", "rows": [{"a": 1, "b": None}], "ratio": 0.5, "ok": True}
+    key = memory.store_analysis_result("s1", data)
+
+    file_path = memory._find_memory_file(key, ".msgpack")
+    with open(file_path, "rb") as f:
+        stored = msgpack.unpackb(f.read(), raw=False)
+    assert stored["version"] == 2
+    assert stored["data"] == data
+    assert ExternalMemory(str(tmp_path)).retrieve_analysis_result(key) == data
+
+
+def test_non_string_dict_keys_round_trip(tmp_path):
+    memory = ExternalMemory(str(tmp_path))
+    # Shape produced by DataFrame.to_dict(): column -> row index -> value
+    data = {"columns": {"revenue": {0: 10.5, 1: 20.0}, "units": {0: 1, 1: 2}}}
+    key = memory.store_analysis_result("s1", data)
+
+    assert memory.retrieve_analysis_result(key) == data
+    assert memory.retrieve_analysis_result(key) == data
+    assert ExternalMemory(str(tmp_path)).retrieve_analysis_result(key) == data
+
+
+def test_large_result_payload_round_trips(tmp_path):
+    memory = ExternalMemory(str(tmp_path))
+    rows = [{"id": i, "name": f"row {i}"} for i in range(100)]
+    key = memory.store_large_result("s1", rows, "100 rows")
+
+    result = memory.retrieve_analysis_result(key)
+    assert result["summary"] == "100 rows"
+    assert result["full_data"] == rows
+
+
+def test_large_results_are_not_kept_in_read_cache(tmp_path):
+    memory = ExternalMemory(str(tmp_path))
+    key = memory.store_large_result("s1", list(range(1000)), "1000 rows")
+
+    assert memory.retrieve_analysis_result(key)["full_data"] == list(range(1000))
+    assert memory._read_cache_bytes == 0
+    assert not memory._read_cache
+
+
+def test_read_cache_is_bounded_by_total_bytes(tmp_path, monkeypatch):
+    monkeypatch.setattr(external_memory, "_READ_CACHE_MAX_BYTES", 2500)
+    memory = ExternalMemory(str(tmp_path))
+    keys = [
+        memory.store_analysis_result("s1", {"blob": "x" * 1000}) for _ in range(3)
+    ]
+    big_key = memory.store_analysis_result("s1", {"blob": "x" * 5000})
+    for key in keys + [big_key]:
+        memory.retrieve_analysis_result(key)
+
+    cached_keys = [memory_key for memory_key, _ in memory._read_cache]
+    assert cached_keys == keys[1:]
+    assert memory._read_cache_bytes == sum(map(len, memory._read_cache.values()))
+    assert memory._read_cache_bytes <= 2500
+
+
+def test_legacy_json_memory_files_are_still_read(tmp_path):
+    memory = ExternalMemory(str(tmp_path))
+    legacy = {
+        "session_id": "s1",
+        "memory_key": "s1_legacy01",
+        "timestamp": "2025-01-01T00:00:00",
+        "data": {"value": 1},
+    }
+    with open(tmp_path / "s1_legacy01.json", "w", encoding="utf-8") as f:
+        json.dump(legacy, f)
+
+    assert memory.retrieve_analysis_result("s1_legacy01") == {"value": 1}
+
+
+def test_atomic_write_replaces_file_without_leftovers(tmp_path):
+    path = str(tmp_path / "memory.msgpack")
+    _write_atomic(path, [b"old"])
+
+    assert _write_atomic(path, [b"new ", b"content"]) == 11
+    with open(path, "rb") as f:
+        assert f.read() == b"new content"
+    assert os.listdir(tmp_path) == ["memory.msgpack"]
+
+
+def test_failed_atomic_write_keeps_original_and_removes_temp_file(tmp_path):
+    path = str(tmp_path / "memory.msgpack")
+    _write_atomic(path, [b"original"])
+
+    def failing_chunks():
+        yield b"partial"
+        raise RuntimeError("encoding failed")
+
+    with pytest.raises(RuntimeError):
+        _write_atomic(path, failing_chunks())
+    with open(path, "rb") as f:
+        assert f.read() == b"original"
+    assert os.listdir(tmp_path) == ["memory.msgpack"]
+
+
+def test_concurrent_atomic_writes_never_interleave(tmp_path):
+    path = str(tmp_path / "memory.msgpack")
+    payloads = [bytes([i]) * 200_000 for i in range(8)]
+    threads = [
+        threading.Thread(
+            target=_write_atomic, args=(path, [payload[:100_000], payload[100_000:]])
+        )
+        for payload in payloads
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with open(path, "rb") as f:
+        assert f.read() in payloads
+    assert os.listdir(tmp_path) == ["memory.msgpack"]
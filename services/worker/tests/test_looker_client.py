@@ -0,0 +1,113 @@
+"""Tests for the LookerClient GET response cache."""
+
+import asyncio
+import json
+
+import httpx
+
+from app.tools.looker import client as looker_client
+from app.tools.looker.client import LookerClient
+
+DASHBOARD = {"id": "1", "title": "Sales", "dashboard_elements": [{"id": "e1"}]}
+
+
+class FakeLooker:
+    """Minimal Looker API: login, one dashboard with an ETag, and query runs."""
+
+    def __init__(self):
+        self.requests = []
+        self.etag = '"v1"'
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/api/4.0")
+        if path == "/login":
+            return httpx.Response(200, json={"access_token": "t", "expires_in": 3600})
+        if_none_match = request.headers.get("If-None-Match")
+        self.requests.append((request.method, path, if_none_match))
+        if path == "/dashboards/1" and request.method == "GET":
+            if if_none_match == self.etag:
+                return httpx.Response(304, headers={"ETag": self.etag})
+            return httpx.Response(
+                200, content=json.dumps(DASHBOARD).encode(), headers={"ETag": self.etag}
+            )
+        if path == "/dashboards/1" and request.method == "PUT":
+            return httpx.Response(200, json=DASHBOARD)
+        if path.startswith("/queries/"):
+            return httpx.Response(200, json=[{"row": 1}])
+        return httpx.Response(404)
+
+
+def _client(fake: FakeLooker) -> LookerClient:
+    client = LookerClient("https://looker.example.com", "id", "secret")
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(fake.handle))
+    return client
+
+
+def test_get_is_served_from_cache_within_ttl():
+    fake = FakeLooker()
+
+    async def run():
+        client = _client(fake)
+        first = await client.get_dashboard("1")
+        second = await client.get_dashboard("1")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second == DASHBOARD
+    assert fake.requests == [("GET", "/dashboards/1", None)]
+
+
+def test_cached_responses_are_independent_copies():
+    fake = FakeLooker()
+
+    async def run():
+        client = _client(fake)
+        first = await client.get_dashboard("1")
+        first["dashboard_elements"][0]["id"] = "changed"
+        first["dashboard_elements"].append({"id": "e2"})
+        return await client.get_dashboard("1")
+
+    assert asyncio.run(run()) == DASHBOARD
+
+
+def test_expired_entry_is_revalidated_with_etag(monkeypatch):
+    monkeypatch.setattr(looker_client, "GET_CACHE_TTL", -1)
+    fake = FakeLooker()
+
+    async def run():
+        client = _client(fake)
+        await client.get_dashboard("1")
+        return await client.get_dashboard("1")
+
+    assert asyncio.run(run()) == DASHBOARD
+    assert fake.requests == [
+        ("GET", "/dashboards/1", None),
+        ("GET", "/dashboards/1", '"v1"'),
+    ]
+
+
+def test_writes_and_invalidate_cache_clear_cached_gets():
+    fake = FakeLooker()
+
+    async def run():
+        client = _client(fake)
+        await client.get_dashboard("1")
+        await client.update_dashboard("1", {"title": "Sales"})
+        await client.get_dashboard("1")
+        client.invalidate_cache()
+        await client.get_dashboard("1")
+
+    asyncio.run(run())
+    assert [method for method, _, _ in fake.requests] == ["GET", "PUT", "GET", "GET"]
+
+
+def test_query_runs_are_never_cached():
+    fake = FakeLooker()
+
+    async def run():
+        client = _client(fake)
+        await client._make_request("GET", "/queries/7/run/json")
+        await client._make_request("GET", "/queries/7/run/json")
+
+    asyncio.run(run())
+    assert len(fake.requests) == 2
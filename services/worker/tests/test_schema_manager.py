@@ -0,0 +1,122 @@
+"""Tests for the SchemaManager on-disk schema cache."""
+
+import json
+import os
+
+from app.tools.bigquery.schema_manager import SchemaManager
+
+
+class FakeBigQueryClient:
+    """In-memory stand-in for BigQueryClient's metadata methods."""
+
+    def __init__(self, project_id, tables):
+        self.project_id = project_id
+        # dataset -> table -> modified marker
+        self.tables = tables
+        self.schema_fetches = []
+
+    def list_datasets(self):
+        return list(self.tables)
+
+    def list_tables(self, dataset_id):
+        return list(self.tables[dataset_id])
+
+    def get_tables_info(self, dataset_id, table_ids, include_schema=True):
+        if table_ids is None:
+            table_ids = self.list_tables(dataset_id)
+        if include_schema:
+            self.schema_fetches.extend(f"{dataset_id}.{t}" for t in table_ids)
+        infos = []
+        for table_id in table_ids:
+            info = {
+                "id": table_id,
+                "project_id": self.project_id,
+                "description": None,
+                "created": None,
+                "modified": self.tables[dataset_id][table_id],
+                "num_rows": 1,
+                "num_bytes": 1,
+            }
+            if include_schema:
+                info["schema"] = [
+                    {"name": "id", "field_type": "INT64", "mode": "NULLABLE"}
+                ]
+            infos.append(info)
+        return infos
+
+    def get_table_info(self, dataset_id, table_id):
+        return self.get_tables_info(dataset_id, [table_id])[0]
+
+
+def _keys(path):
+    with open(path, encoding="utf-8") as f:
+        return sorted(json.load(f))
+
+
+def test_schemas_round_trip_through_disk_cache(tmp_path):
+    path = str(tmp_path / "schemas.json")
+    client = FakeBigQueryClient("p", {"ds": {"t1": "m1", "t2": "m2"}})
+    manager = SchemaManager(client, cache_path=path)
+    manager.get_dataset_schemas("ds")
+    manager.save_cache()
+    assert _keys(path) == ["p.ds.t1", "p.ds.t2"]
+
+    client.schema_fetches.clear()
+    reloaded = SchemaManager(client, cache_path=path)
+    schemas = reloaded.get_dataset_schemas("ds")
+    reloaded.save_cache()
+
+    assert [schema.table_id for schema in schemas] == ["t1", "t2"]
+    assert schemas[0].field_names == ["id"]
+    # Unchanged tables are confirmed by modified time, not refetched
+    assert client.schema_fetches == []
+
+
+def test_changed_tables_are_refetched_after_reload(tmp_path):
+    path = str(tmp_path / "schemas.json")
+    client = FakeBigQueryClient("p", {"ds": {"t1": "m1", "t2": "m2"}})
+    manager = SchemaManager(client, cache_path=path)
+    manager.get_dataset_schemas("ds")
+    manager.save_cache()
+
+    client.tables["ds"]["t2"] = "changed"
+    client.schema_fetches.clear()
+    reloaded = SchemaManager(client, cache_path=path)
+    schemas = reloaded.get_dataset_schemas("ds")
+    reloaded.save_cache()
+
+    assert client.schema_fetches == ["ds.t2"]
+    assert [schema.modified for schema in schemas] == ["m1", "changed"]
+
+
+def test_expired_entries_are_not_loaded(tmp_path):
+    path = str(tmp_path / "schemas.json")
+    client = FakeBigQueryClient("p", {"ds": {"t1": "m1"}})
+    manager = SchemaManager(client, cache_path=path)
+    manager.get_dataset_schemas("ds")
+    manager.save_cache()
+
+    reloaded = SchemaManager(client, cache_path=path, ttl_seconds=-1)
+    assert reloaded.get_dataset_schemas("ds")[0].table_id == "t1"
+    assert client.schema_fetches == ["ds.t1", "ds.t1"]
+    reloaded.save_cache()
+
+
+def test_shared_cache_file_keeps_other_projects(tmp_path):
+    path = str(tmp_path / "schemas.json")
+    client_p = FakeBigQueryClient("p", {"ds": {"t1": "m1"}})
+    manager_p = SchemaManager(client_p, cache_path=path)
+    manager_p.get_dataset_schemas("ds")
+    manager_p.save_cache()
+    client_q = FakeBigQueryClient("q", {"ds": {"t9": "m9"}})
+    manager_q = SchemaManager(client_q, cache_path=path)
+    manager_q.get_dataset_schemas("ds")
+    manager_q.save_cache()
+
+    assert _keys(path) == ["p.ds.t1", "q.ds.t9"]
+
+    manager_q.clear_cache()
+    manager_q.save_cache()
+
+    assert _keys(path) == ["p.ds.t1"]
+    assert os.listdir(tmp_path) == ["schemas.json"]